@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+import json
+from typing import Any
+
+
+__all__ = ["BACKEND", "dumps_bytes", "loads"]
+
+
+# Fastest available codec first. orjson has no wheels for some 32-bit/ARM
+# builds, where python-rapidjson or ujson usually still install.
+try:
+    import orjson as _codec
+
+    BACKEND = "orjson"
+except ImportError:
+    try:
+        import rapidjson as _codec
+
+        BACKEND = "rapidjson"
+    except ImportError:
+        try:
+            import ujson as _codec
+
+            BACKEND = "ujson"
+        except ImportError:
+            _codec = None
+            BACKEND = "json"
+
+
+def _stdlib_dumps_bytes(obj: Any) -> bytes:
+    # Compact separators and raw UTF-8 instead of \uXXXX escapes: smaller
+    # bodies and less escaping work for non-ASCII names.
+    try:
+        return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+    except UnicodeEncodeError:
+        # A lone surrogate has no UTF-8 form; let json escape it instead.
+        return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+
+if BACKEND == "orjson":
+    _OPTIONS = _codec.OPT_NON_STR_KEYS
+
+    def _fast_dumps_bytes(obj: Any) -> bytes:
+        return _codec.dumps(obj, option=_OPTIONS)
+
+elif BACKEND == "rapidjson":
+
+    def _fast_dumps_bytes(obj: Any) -> bytes:
+        return _codec.dumps(obj, ensure_ascii=False).encode("utf-8")
+
+elif BACKEND == "ujson":
+
+    def _fast_dumps_bytes(obj: Any) -> bytes:
+        return _codec.dumps(
+            obj, ensure_ascii=False, escape_forward_slashes=False
+        ).encode("utf-8")
+
+else:
+    _fast_dumps_bytes = _stdlib_dumps_bytes
+
+
+def dumps_bytes(obj: Any) -> bytes:
+    try:
+        return _fast_dumps_bytes(obj)
+    except (TypeError, ValueError, OverflowError):
+        # Whatever the fast codec rejects (oversized ints, odd key types)
+        # gets the stdlib's more permissive encoder.
+        return _stdlib_dumps_bytes(obj)
+
+
+def loads(data: bytes | str) -> Any:
+    if _codec is None:
+        return json.loads(data)
+    try:
+        return _codec.loads(data)
+    except ValueError:
+        # Re-parse with the stdlib so callers get its json.JSONDecodeError
+        # (or UnicodeDecodeError) whichever codec is in use, and so input
+        # only the stdlib accepts (NaN, huge ints) still parses.
+        return json.loads(data)
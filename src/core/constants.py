@@ -21,6 +21,12 @@ HTTP_RETRY_BACKOFF_S: Final[float] = 0.2
 #: ``User-Agent`` header sent on every outbound request.
 HTTP_USER_AGENT: Final[str] = "Histolauncher/1.0"
 
+#: Idle keep-alive connections :mod:`core.http_pool` keeps per host.
+HTTP_POOL_MAX_IDLE_PER_HOST: Final[int] = 4
+
+#: Redirects :mod:`core.http_pool` follows before giving up.
+HTTP_MAX_REDIRECTS: Final[int] = 5
+
 # ---------------------------------------------------------------------------
 # Cache TTLs (seconds)
 # ---------------------------------------------------------------------------
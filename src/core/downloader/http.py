@@ -11,6 +11,7 @@ import urllib.request
 from dataclasses import dataclass
 from typing import Any, Callable, Iterable, Iterator, List, Optional, Tuple
 
+from core import http_pool
 from core.constants import DOWNLOAD_PARALLEL_WORKERS
 from core.downloader.errors import DownloadCancelled, DownloadFailed, HashMismatch
 from core.logger import safe_print
@@ -441,8 +442,9 @@ class HttpClient:
                         if self._opener is not None:
                             with self._opener.open(req, **kwargs) as resp:
                                 return resp.read()
-                        with urllib.request.urlopen(req, **kwargs) as resp:
-                            return resp.read()
+                        return http_pool.request(
+                            candidate, headers=merged_headers, **kwargs
+                        ).body
                     except urllib.error.HTTPError as exc:
                         last_error = exc
                         last_status = exc.code
@@ -498,7 +500,11 @@ class HttpClient:
             kwargs["context"] = ssl_context
         if self._opener is not None:
             return self._opener.open(request, **kwargs)
-        return urllib.request.urlopen(request, **kwargs)
+        # Asset and library downloads hit the same few hosts thousands of
+        # times; the pool saves a TCP+TLS handshake on each of them.
+        return http_pool.open_stream(
+            request.full_url, headers=dict(request.header_items()), **kwargs
+        )
 
     def _stream_one(
         self,
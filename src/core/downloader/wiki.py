@@ -1,17 +1,25 @@
 from __future__ import annotations
 
+import functools
 import re
 from typing import Optional
 
 from core.settings import load_global_settings
 
 
-def _wiki_image_url(version_id: str, version_type: str) -> Optional[str]:
-    settings = load_global_settings()
-    low_data = settings.get("low_data_mode") == "1"
+def _wiki_image_url(
+    version_id: str, version_type: str, *, low_data: bool | None = None
+) -> Optional[str]:
+    # Callers resolving a whole list pass low_data once instead of having
+    # every entry re-read the settings.
+    if low_data is None:
+        low_data = load_global_settings().get("low_data_mode") == "1"
     pixel_res = round(260 / (2 if low_data else 1))
-    version_id_str = str(version_id or "")
+    return _build_wiki_image_url(str(version_id or ""), pixel_res)
 
+
+@functools.lru_cache(maxsize=4096)
+def _build_wiki_image_url(version_id_str: str, pixel_res: int) -> str:
     prefix = "Java_Edition_"
     clean_id = version_id_str
     lid = version_id_str.lower()
@@ -4,14 +4,15 @@ import json
 import os
 import ssl
 import tempfile
+import threading
 import time
 import urllib.error
-import urllib.request
 import zlib
 from collections.abc import Callable, Mapping
 from pathlib import Path
 from typing import Any
 
+from core import _fastjson, http_pool
 from core.constants import (
     DOWNLOAD_CHUNK_BYTES,
     HTTP_DEFAULT_TIMEOUT_S,
@@ -28,6 +29,10 @@ ProgressCallback = Callable[[int, int], None]
 
 _PERMANENT_HTTP_CODES = frozenset({400, 401, 403, 404, 405, 410})
 
+# url -> (etag, last_modified, parsed body) for get_json(..., revalidate=True).
+_revalidation_cache: dict[str, tuple[str | None, str | None, Any]] = {}
+_revalidation_cache_lock = threading.Lock()
+
 
 class HttpClientError(RuntimeError):
     def __init__(
@@ -123,17 +128,40 @@ class HttpClient:
         *,
         headers: Mapping[str, str] | None = None,
         timeout: float | None = None,
+        revalidate: bool = False,
     ) -> Any:
-        body = self._request(url, headers=headers, timeout=timeout)
-        try:
-            return json.loads(body.decode("utf-8"))
-        except (UnicodeDecodeError, json.JSONDecodeError) as exc:
-            raise HttpClientError(
-                f"failed to parse JSON from {url}: {exc}",
-                url=url,
-                attempts=self._retry_attempts,
-                cause=exc,
-            ) from exc
+        """Fetch and parse JSON from ``url``.
+
+        With ``revalidate`` the response validators are remembered per URL and
+        sent on the next call; a 304 then returns the previously parsed object
+        itself, so callers can tell "unchanged" apart by identity.
+        """
+        if not revalidate:
+            return self._parse_json(url, self._request(url, headers=headers, timeout=timeout))
+
+        with _revalidation_cache_lock:
+            cached = _revalidation_cache.get(url)
+        conditional = dict(headers or {})
+        if cached is not None:
+            etag, last_modified, _ = cached
+            if etag:
+                conditional["If-None-Match"] = etag
+            if last_modified:
+                conditional["If-Modified-Since"] = last_modified
+
+        status, resp_headers, body = self._fetch(url, headers=conditional, timeout=timeout)
+        if status == 304 and cached is not None:
+            return cached[2]
+
+        data = self._parse_json(url, body)
+        etag = resp_headers.get("ETag")
+        last_modified = resp_headers.get("Last-Modified")
+        with _revalidation_cache_lock:
+            if etag or last_modified:
+                _revalidation_cache[url] = (etag, last_modified, data)
+            else:
+                _revalidation_cache.pop(url, None)
+        return data
 
     def stream_to(
         self,
@@ -167,8 +195,12 @@ class HttpClient:
                 if used_insecure and candidate.lower().startswith("https://"):
                     context = _build_unverified_context()
                 try:
-                    req = self._build_request(candidate, merged_headers)
-                    with urllib.request.urlopen(req, timeout=effective_timeout, context=context) as resp:
+                    with http_pool.open_stream(
+                        candidate,
+                        headers=self._merged_headers(merged_headers),
+                        timeout=effective_timeout,
+                        context=context,
+                    ) as resp:
                         last_status = getattr(resp, "status", None)
                         total = int(resp.headers.get("Content-Length") or -1)
                         written = 0
@@ -222,6 +254,17 @@ class HttpClient:
     # Internals
     # ------------------------------------------------------------------
 
+    def _parse_json(self, url: str, body: bytes) -> Any:
+        try:
+            return _fastjson.loads(body)
+        except (UnicodeDecodeError, json.JSONDecodeError) as exc:
+            raise HttpClientError(
+                f"failed to parse JSON from {url}: {exc}",
+                url=url,
+                attempts=self._retry_attempts,
+                cause=exc,
+            ) from exc
+
     def _request(
         self,
         url: str,
@@ -229,6 +272,16 @@ class HttpClient:
         headers: Mapping[str, str] | None,
         timeout: float | None,
     ) -> bytes:
+        return self._fetch(url, headers=headers, timeout=timeout)[2]
+
+    def _fetch(
+        self,
+        url: str,
+        *,
+        headers: Mapping[str, str] | None,
+        timeout: float | None,
+    ) -> tuple[int, Any, bytes]:
+        """Return ``(status, headers, decoded body)``; a 304 comes back with an empty body."""
         effective_timeout = self._timeout if timeout is None else timeout
         last_error: BaseException | None = None
         last_status: int | None = None
@@ -243,11 +296,15 @@ class HttpClient:
                     context = _build_unverified_context()
 
                 try:
-                    req = self._build_request(candidate, headers)
-                    with urllib.request.urlopen(req, timeout=effective_timeout, context=context) as resp:
-                        last_status = getattr(resp, "status", None)
-                        raw = resp.read()
-                        return _decode_content_encoding(raw, resp.headers.get("Content-Encoding"))
+                    resp = http_pool.request(
+                        candidate,
+                        headers=self._merged_headers(headers),
+                        timeout=effective_timeout,
+                        context=context,
+                    )
+                    last_status = resp.status
+                    body = _decode_content_encoding(resp.body, resp.headers.get("Content-Encoding"))
+                    return resp.status, resp.headers, body
                 except ssl.SSLError as exc:
                     last_error = exc
                     if self._allow_insecure_fallback and not used_insecure:
@@ -255,6 +312,8 @@ class HttpClient:
                         continue
                     self._sleep_between_attempts(attempt)
                 except urllib.error.HTTPError as exc:
+                    if exc.code == 304:
+                        return 304, exc.headers, b""
                     last_error = exc
                     last_status = int(exc.code)
                     if exc.code in _PERMANENT_HTTP_CODES:
@@ -273,15 +332,11 @@ class HttpClient:
             cause=last_error,
         )
 
-    def _build_request(
-        self,
-        url: str,
-        headers: Mapping[str, str] | None,
-    ) -> urllib.request.Request:
+    def _merged_headers(self, headers: Mapping[str, str] | None) -> dict[str, str]:
         merged: dict[str, str] = {"User-Agent": self._user_agent, "Accept-Encoding": "gzip, deflate"}
         if headers:
             merged.update({str(k): str(v) for k, v in headers.items()})
-        return urllib.request.Request(url, headers=merged)
+        return merged
 
     def _candidates(self, url: str) -> list[str]:
         candidates: list[str] = []
@@ -0,0 +1,278 @@
+from __future__ import annotations
+
+import functools
+import http.client
+import ssl
+import threading
+import urllib.error
+import urllib.request
+from collections.abc import Mapping
+from email.message import Message
+from urllib.parse import urljoin, urlsplit
+
+from core.constants import HTTP_MAX_REDIRECTS, HTTP_POOL_MAX_IDLE_PER_HOST
+
+__all__ = ["PooledResponse", "PooledStream", "close_idle_connections", "open_stream", "request"]
+
+
+_REDIRECT_CODES = frozenset({301, 302, 303, 307, 308})
+
+# A reused keep-alive socket may have been closed by the server while idle;
+# these errors on a reused connection mean "retry on a fresh one".
+_STALE_CONNECTION_ERRORS = (
+    http.client.RemoteDisconnected,
+    http.client.BadStatusLine,
+    BrokenPipeError,
+    ConnectionResetError,
+    ConnectionAbortedError,
+)
+
+_PoolKey = tuple[str, str, int]
+
+_idle: dict[_PoolKey, list[http.client.HTTPConnection]] = {}
+_idle_lock = threading.Lock()
+_default_context: ssl.SSLContext | None = None
+_default_context_lock = threading.Lock()
+
+
+class PooledResponse:
+    __slots__ = ("url", "status", "headers", "body")
+
+    def __init__(self, url: str, status: int, headers: Message, body: bytes) -> None:
+        self.url = url
+        self.status = status
+        self.headers = headers
+        self.body = body
+
+
+def _ssl_context() -> ssl.SSLContext:
+    global _default_context
+    if _default_context is None:
+        # Loading the trust store is slow; the threaded server can get here
+        # from several requests at once on startup, so build it only once.
+        with _default_context_lock:
+            if _default_context is None:
+                _default_context = ssl.create_default_context()
+    return _default_context
+
+
+def _uses_env_proxy(scheme: str, host: str) -> bool:
+    proxies = urllib.request.getproxies()
+    if scheme not in proxies:
+        return False
+    try:
+        return not urllib.request.proxy_bypass(host)
+    except Exception:
+        return True
+
+
+def _acquire(key: _PoolKey, timeout: float | None) -> tuple[http.client.HTTPConnection, bool]:
+    with _idle_lock:
+        idle = _idle.get(key)
+        conn = idle.pop() if idle else None
+    if conn is not None:
+        conn.timeout = timeout
+        if conn.sock is not None:
+            conn.sock.settimeout(timeout)
+        return conn, True
+
+    scheme, host, port = key
+    if scheme == "https":
+        return http.client.HTTPSConnection(host, port, timeout=timeout, context=_ssl_context()), False
+    return http.client.HTTPConnection(host, port, timeout=timeout), False
+
+
+def _release(key: _PoolKey, conn: http.client.HTTPConnection) -> None:
+    with _idle_lock:
+        idle = _idle.setdefault(key, [])
+        if len(idle) < HTTP_POOL_MAX_IDLE_PER_HOST:
+            idle.append(conn)
+            return
+    conn.close()
+
+
+def close_idle_connections() -> None:
+    with _idle_lock:
+        conns = [conn for idle in _idle.values() for conn in idle]
+        _idle.clear()
+    for conn in conns:
+        try:
+            conn.close()
+        except Exception:
+            pass
+
+
+@functools.lru_cache(maxsize=512)
+def _pool_target(url: str) -> tuple[_PoolKey, str] | None:
+    # The same handful of URLs (version.dat, manifests, API endpoints) are
+    # requested over and over; parse each one once.
+    parts = urlsplit(url)
+    scheme = parts.scheme.lower()
+    if scheme not in ("http", "https") or not parts.hostname:
+        return None
+
+    key: _PoolKey = (scheme, parts.hostname, parts.port or (443 if scheme == "https" else 80))
+    target = parts.path or "/"
+    if parts.query:
+        target = f"{target}?{parts.query}"
+    return key, target
+
+
+def _open_once(
+    url: str, headers: Mapping[str, str], timeout: float | None
+) -> tuple[_PoolKey, http.client.HTTPConnection, http.client.HTTPResponse]:
+    parsed = _pool_target(url)
+    if parsed is None:
+        raise urllib.error.URLError(f"unsupported URL: {url}")
+    key, target = parsed
+
+    while True:
+        conn, reused = _acquire(key, timeout)
+        try:
+            conn.request("GET", target, headers=dict(headers))
+            return key, conn, conn.getresponse()
+        except _STALE_CONNECTION_ERRORS:
+            conn.close()
+            if reused:
+                continue
+            raise
+        except BaseException:
+            conn.close()
+            raise
+
+
+def _finish(key: _PoolKey, conn: http.client.HTTPConnection, resp: http.client.HTTPResponse) -> None:
+    # Only a fully read body leaves the connection ready for the next request.
+    if resp.will_close or not resp.isclosed():
+        conn.close()
+    else:
+        _release(key, conn)
+
+
+class PooledStream:
+    """A streaming response whose connection returns to the pool on close."""
+
+    __slots__ = ("url", "status", "headers", "_key", "_conn", "_resp")
+
+    def __init__(
+        self,
+        url: str,
+        key: _PoolKey,
+        conn: http.client.HTTPConnection,
+        resp: http.client.HTTPResponse,
+    ) -> None:
+        self.url = url
+        self.status = resp.status
+        self.headers = resp.headers
+        self._key = key
+        self._conn = conn
+        self._resp = resp
+
+    def read(self, amt: int | None = None) -> bytes:
+        return self._resp.read(amt)
+
+    def getcode(self) -> int:
+        return self.status
+
+    def close(self) -> None:
+        conn, self._conn = self._conn, None
+        if conn is not None:
+            _finish(self._key, conn, self._resp)
+
+    def __enter__(self) -> PooledStream:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+
+def _bypasses_pool(url: str, context: ssl.SSLContext | None) -> bool:
+    if context is not None:
+        return True
+    parsed = _pool_target(url)
+    if parsed is None:
+        # Let urllib produce its usual error for odd schemes.
+        return True
+    scheme, host, _ = parsed[0]
+    return _uses_env_proxy(scheme, host)
+
+
+def _open_following_redirects(
+    url: str, headers: Mapping[str, str], timeout: float | None
+) -> tuple[str, _PoolKey, http.client.HTTPConnection, http.client.HTTPResponse]:
+    current = url
+    for _ in range(HTTP_MAX_REDIRECTS + 1):
+        key, conn, resp = _open_once(current, headers, timeout)
+        location = resp.headers.get("Location")
+        if resp.status in _REDIRECT_CODES and location:
+            try:
+                resp.read()
+            finally:
+                _finish(key, conn, resp)
+            current = urljoin(current, location)
+            continue
+        if not 200 <= resp.status < 300:
+            conn.close()
+            raise urllib.error.HTTPError(current, resp.status, resp.reason, resp.headers, None)
+        return current, key, conn, resp
+
+    raise urllib.error.URLError(f"too many redirects (> {HTTP_MAX_REDIRECTS}) for {url}")
+
+
+def request(
+    url: str,
+    *,
+    headers: Mapping[str, str] | None = None,
+    timeout: float,
+    context: ssl.SSLContext | None = None,
+    max_bytes: int | None = None,
+) -> PooledResponse:
+    """GET ``url`` over a kept-alive connection and return the whole body.
+
+    Mirrors ``urllib.request.urlopen`` for the launcher's purposes: redirects
+    are followed and non-2xx statuses raise ``urllib.error.HTTPError``.
+    Requests needing a custom SSL context or an environment proxy go through
+    urllib unchanged. ``max_bytes`` truncates the body instead of buffering
+    whatever the server sends.
+    """
+    merged = {str(k): str(v) for k, v in (headers or {}).items()}
+
+    if _bypasses_pool(url, context):
+        req = urllib.request.Request(url, headers=merged)
+        with urllib.request.urlopen(req, timeout=timeout, context=context) as resp:
+            body = resp.read() if max_bytes is None else resp.read(max_bytes)
+            return PooledResponse(resp.geturl(), resp.status, resp.headers, body)
+
+    final_url, key, conn, resp = _open_following_redirects(url, merged, timeout)
+    try:
+        body = resp.read() if max_bytes is None else resp.read(max_bytes)
+    except BaseException:
+        conn.close()
+        raise
+    _finish(key, conn, resp)
+    return PooledResponse(final_url, resp.status, resp.headers, body)
+
+
+def open_stream(
+    url: str,
+    *,
+    headers: Mapping[str, str] | None = None,
+    timeout: float | None = None,
+    context: ssl.SSLContext | None = None,
+):
+    """Like :func:`request` but hand back the open response for chunked reads.
+
+    Use it as a context manager; the connection is pooled again only when the
+    body was read to the end.
+    """
+    merged = {str(k): str(v) for k, v in (headers or {}).items()}
+
+    if _bypasses_pool(url, context):
+        req = urllib.request.Request(url, headers=merged)
+        kwargs: dict[str, object] = {"context": context}
+        if timeout is not None:
+            kwargs["timeout"] = timeout
+        return urllib.request.urlopen(req, **kwargs)
+
+    final_url, key, conn, resp = _open_following_redirects(url, merged, timeout)
+    return PooledStream(final_url, key, conn, resp)
@@ -9,6 +9,7 @@ from core.settings import (
     normalize_storage_directory_mode,
     validate_custom_storage_directory,
 )
+from core.version_manager import find_installed_version_dir
 
 __all__ = [
     "_restore_neoforge_early_window",
@@ -35,6 +36,10 @@ def _resolve_version_dir(version_identifier):
         parts = version_identifier.replace("\\", "/").split("/", 1)
         category, folder = parts[0], parts[1]
 
+        cached = find_installed_version_dir(category, folder)
+        if cached:
+            return cached
+
         for cat in os.listdir(clients_dir):
             if cat.lower() == category.lower():
                 candidate = os.path.join(clients_dir, cat, folder)
@@ -102,6 +102,8 @@ _ANSI_RE = re.compile(r"\x1b\[[0-9;?]*[A-Za-z]")
 _safe_print_log_path: str | None = None
 _safe_print_log_resolved = False
 _safe_print_log_lock = threading.Lock()
+# Append handle kept open across calls; guarded by _safe_print_log_lock.
+_safe_print_log_file = None
 _console_quiet = threading.Event()
 
 
@@ -131,7 +133,7 @@ def safe_print_context():
 
 
 def _append_safe_print_log(message: str) -> None:
-    global _safe_print_log_path, _safe_print_log_resolved
+    global _safe_print_log_path, _safe_print_log_resolved, _safe_print_log_file
     if not _safe_print_log_resolved:
         with _safe_print_log_lock:
             if not _safe_print_log_resolved:
@@ -144,9 +146,50 @@ def _append_safe_print_log(message: str) -> None:
         plain = _ANSI_RE.sub("", message)
         line = f"{datetime.now():%Y-%m-%d %H:%M:%S} {plain}\n"
         with _safe_print_log_lock:
-            os.makedirs(os.path.dirname(path), exist_ok=True)
-            with open(path, "a", encoding="utf-8", errors="replace") as f:
+            # Reopening the log for every line serialised parallel request
+            # threads on an open/close pair; write to one handle and flush
+            # each line instead.
+            f = _safe_print_log_file
+            if f is not None and _log_file_unlinked(f):
+                # Clear-logs (or the user) removed the file; don't keep
+                # writing into the orphaned inode.
+                _safe_print_log_file = None
+                _close_quietly(f)
+                f = None
+            if f is None:
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                f = open(path, "a", encoding="utf-8", errors="replace")
+                _safe_print_log_file = f
+            try:
                 f.write(line)
+                f.flush()
+            except Exception:
+                _safe_print_log_file = None
+                _close_quietly(f)
+    except Exception:
+        pass
+
+
+def close_safe_print_log() -> None:
+    """Close the held log handle; the next safe_print reopens (or recreates) it."""
+    global _safe_print_log_file
+    with _safe_print_log_lock:
+        f = _safe_print_log_file
+        _safe_print_log_file = None
+    if f is not None:
+        _close_quietly(f)
+
+
+def _log_file_unlinked(f) -> bool:
+    try:
+        return os.fstat(f.fileno()).st_nlink == 0
+    except (OSError, ValueError):
+        return True
+
+
+def _close_quietly(f) -> None:
+    try:
+        f.close()
     except Exception:
         pass
 
@@ -97,7 +97,7 @@ def _fetch_first_available_manifest(
         if not raw_url:
             continue
         try:
-            data = client.get_json(raw_url)
+            data = client.get_json(raw_url, revalidate=True)
         except HttpClientError:
             continue
         if isinstance(data, dict) and isinstance(data.get("versions"), list):
@@ -106,8 +106,11 @@ def _fetch_first_available_manifest(
 
 
 _MANIFEST_CACHE_TTL_S: Final[float] = 300.0
-_manifest_cache: dict[bool, tuple[float, dict[str, Any]]] = {}
+# include_third_party -> (fetched_at, (mojang, omniarchive) raw data, result)
+_manifest_cache: dict[bool, tuple[float, tuple[Any, Any], dict[str, Any]]] = {}
 _manifest_cache_lock = threading.Lock()
+# include_third_party -> (done event, result slot) for the fetch in progress.
+_manifest_inflight: dict[bool, tuple[threading.Event, list[dict[str, Any]]]] = {}
 
 
 def fetch_manifest(
@@ -118,34 +121,76 @@ def fetch_manifest(
     with _manifest_cache_lock:
         cached = _manifest_cache.get(cache_key)
         if cached and (time.monotonic() - cached[0]) < _MANIFEST_CACHE_TTL_S:
-            return cached[1]
+            return cached[2]
+        flight = _manifest_inflight.get(cache_key)
+        leader = flight is None
+        if leader:
+            flight = (threading.Event(), [])
+            _manifest_inflight[cache_key] = flight
+
+    event, slot = flight
+    if not leader:
+        # Someone else is already fetching this manifest; share their result
+        # rather than opening a second set of connections.
+        if event.wait(timeout) and slot:
+            return slot[0]
+        return _fetch_manifest_uncoalesced(timeout, include_third_party, cached)
 
-    result = _fetch_manifest_uncached(
-        timeout=timeout, include_third_party=include_third_party
+    try:
+        result = _fetch_manifest_uncoalesced(timeout, include_third_party, cached)
+        slot.append(result)
+        return result
+    finally:
+        with _manifest_cache_lock:
+            _manifest_inflight.pop(cache_key, None)
+        event.set()
+
+
+def _fetch_manifest_uncoalesced(
+    timeout: float,
+    include_third_party: bool,
+    cached: tuple[float, tuple[Any, Any], dict[str, Any]] | None,
+) -> dict[str, Any]:
+    cache_key = bool(include_third_party)
+    sources = _fetch_manifest_sources(
+        HttpClient(timeout=timeout), include_third_party=include_third_party
     )
+    # The sources are revalidated with ETags; a 304 hands back the very same
+    # parsed objects, and then the previous result (and everything callers
+    # derived from it) is still current.
+    if cached and cached[1][0] is sources[0] and cached[1][1] is sources[1]:
+        result = cached[2]
+    else:
+        result = _build_manifest_result(*sources, include_third_party=include_third_party)
     if result.get("data") is not None:
         with _manifest_cache_lock:
-            _manifest_cache[cache_key] = (time.monotonic(), result)
+            _manifest_cache[cache_key] = (time.monotonic(), sources, result)
     return result
 
 
-def _fetch_manifest_uncached(
-    timeout: float = HTTP_DEFAULT_TIMEOUT_S,
-    include_third_party: bool = False,
-) -> dict[str, Any]:
-    client = HttpClient(timeout=timeout)
-
+def _fetch_manifest_sources(
+    client: HttpClient, include_third_party: bool = False
+) -> tuple[dict[str, Any] | None, dict[str, Any] | None]:
     mojang_data = _fetch_first_available_manifest(client, DEFAULT_MANIFEST_URLS)
 
     omniarchive_data: dict[str, Any] | None = None
     if include_third_party:
         try:
-            data = client.get_json(OMNIARCHIVE_MANIFEST_URL)
+            data = client.get_json(OMNIARCHIVE_MANIFEST_URL, revalidate=True)
         except HttpClientError:
             data = None
         if isinstance(data, dict) and isinstance(data.get("versions"), list):
             omniarchive_data = data
 
+    return mojang_data, omniarchive_data
+
+
+def _build_manifest_result(
+    mojang_data: dict[str, Any] | None,
+    omniarchive_data: dict[str, Any] | None,
+    *,
+    include_third_party: bool = False,
+) -> dict[str, Any]:
     if mojang_data is None and omniarchive_data is None:
         return {"data": None, "source": None}
 
@@ -21,10 +21,12 @@ def _client() -> HttpClient:
     return HttpClient(timeout=MODLOADER_HTTP_TIMEOUT_S)
 
 
-def _http_get_json(url: str, timeout: float = MODLOADER_HTTP_TIMEOUT_S) -> Any:
+def _http_get_json(
+    url: str, timeout: float = MODLOADER_HTTP_TIMEOUT_S, *, revalidate: bool = False
+) -> Any:
     client = HttpClient(timeout=timeout)
     try:
-        return client.get_json(url)
+        return client.get_json(url, revalidate=revalidate)
     except HttpClientError as exc:
         raise RuntimeError(f"Failed to fetch {url}: {exc}") from exc
 
@@ -90,7 +90,7 @@ def _load_manifest() -> list[dict[str, Any]]:
         return cached
 
     try:
-        data = _http_get_json(FORGE_LEGACY_MANIFEST_URL)
+        data = _http_get_json(FORGE_LEGACY_MANIFEST_URL, revalidate=True)
     except RuntimeError as exc:
         safe_print(f"[modloaders] Failed to fetch legacy Forge manifest: {exc}")
         with _stale_manifest_lock:
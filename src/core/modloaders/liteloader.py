@@ -37,7 +37,7 @@ def _load_manifest() -> dict[str, Any]:
         return cached
 
     try:
-        data = _http_get_json(LITELOADER_VERSIONS_MANIFEST_URL)
+        data = _http_get_json(LITELOADER_VERSIONS_MANIFEST_URL, revalidate=True)
     except RuntimeError as exc:
         safe_print(f"[modloaders] Failed to fetch LiteLoader versions manifest: {exc}")
         with _stale_manifest_lock:
@@ -79,7 +79,7 @@ def _load_manifest() -> list[dict[str, Any]]:
         return cached
 
     try:
-        data = _http_get_json(RISUGAMI_MODLOADER_MANIFEST_URL)
+        data = _http_get_json(RISUGAMI_MODLOADER_MANIFEST_URL, revalidate=True)
     except RuntimeError as exc:
         safe_print(f"[modloaders] Failed to fetch Risugami ModLoader manifest: {exc}")
         with _stale_manifest_lock:
@@ -28,6 +28,7 @@ from core.settings.profiles import (
     get_active_profile_id,
     get_active_scope_profile_id,
     get_mods_profile_dir,
+    get_scope_profiles_state,
     get_settings_path,
     get_token_path,
     get_versions_profile_dir,
@@ -66,6 +67,7 @@ __all__ = [
     "get_base_dir",
     "get_default_minecraft_dir",
     "get_mods_profile_dir",
+    "get_scope_profiles_state",
     "get_settings_path",
     "get_token_path",
     "get_versions_profile_dir",
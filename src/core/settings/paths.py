@@ -18,10 +18,19 @@ __all__ = [
 ]
 
 
+_ensured_base_dir: str | None = None
+_ensured_settings_dir: str | None = None
+
+
 def get_base_dir() -> str:
-    user = os.path.expanduser("~")
-    base = os.path.join(user, ".histolauncher")
-    os.makedirs(base, exist_ok=True)
+    global _ensured_base_dir
+
+    base = os.path.join(os.path.expanduser("~"), ".histolauncher")
+    # Called on nearly every request; only touch the filesystem the first time
+    # (or if the home directory changes underneath us).
+    if base != _ensured_base_dir:
+        os.makedirs(base, exist_ok=True)
+        _ensured_base_dir = base
     return base
 
 
@@ -39,8 +48,13 @@ def get_profiles_root_dir() -> str:
 
 
 def get_profiles_settings_dir() -> str:
+    global _ensured_settings_dir
+
     path = os.path.join(get_profiles_root_dir(), "settings")
-    os.makedirs(path, exist_ok=True)
+    # Resolved several times per settings load; create it once, as above.
+    if path != _ensured_settings_dir:
+        os.makedirs(path, exist_ok=True)
+        _ensured_settings_dir = path
     return path
 
 
@@ -38,6 +38,7 @@ __all__ = [
     "get_active_profile_id",
     "get_active_scope_profile_id",
     "get_mods_profile_dir",
+    "get_scope_profiles_state",
     "get_settings_path",
     "get_token_path",
     "get_versions_profile_dir",
@@ -66,6 +67,11 @@ def safe_profile_id(name: str | None) -> str:
     return raw[:MAX_PROFILE_ID_LEN]
 
 
+# meta path -> ((st_mtime_ns, st_size), parsed profiles.json)
+_meta_cache: dict[str, tuple[tuple[int, int], dict[str, Any]]] = {}
+_meta_cache_lock = threading.Lock()
+
+
 def _default_meta() -> dict[str, Any]:
     return {
         "active": "default",
@@ -85,6 +91,8 @@ def _write_default_settings_file(path: str) -> None:
 
 def _atomic_save_meta(meta_path: str, meta: dict[str, Any]) -> None:
     os.makedirs(os.path.dirname(meta_path), exist_ok=True)
+    with _meta_cache_lock:
+        _meta_cache.pop(meta_path, None)
 
     with META_WRITE_LOCK:
         last_error: Exception | None = None
@@ -110,19 +118,40 @@ def _atomic_save_meta(meta_path: str, meta: dict[str, Any]) -> None:
     raise RuntimeError("Failed to save profiles metadata")
 
 
+def _copy_meta(meta: dict[str, Any]) -> dict[str, Any]:
+    # Callers edit the profiles list in place before saving.
+    return dict(
+        meta,
+        profiles=[dict(p) if isinstance(p, dict) else p for p in meta["profiles"]],
+    )
+
+
 def _load_meta_from_path(meta_path: str) -> dict[str, Any]:
-    if not os.path.exists(meta_path):
+    # Every settings load resolves the active profile through here, so keep
+    # the parsed file and re-read it only when its stat changes. A missing
+    # file costs the one stat instead of an exists() check and an open().
+    try:
+        st = os.stat(meta_path)
+    except OSError:
         return _default_meta()
+    signature = (st.st_mtime_ns, st.st_size)
+    with _meta_cache_lock:
+        cached = _meta_cache.get(meta_path)
+    if cached is not None and cached[0] == signature:
+        return _copy_meta(cached[1])
+
     try:
-        with open(meta_path, encoding="utf-8") as f:
-            data = json.load(f)
-    except (OSError, json.JSONDecodeError):
+        with open(meta_path, "rb") as f:
+            data = json.loads(f.read())
+    except (OSError, ValueError):
         return _default_meta()
     if not isinstance(data, dict):
         return _default_meta()
     if not isinstance(data.get("profiles"), list) or not isinstance(data.get("active"), str):
         return _default_meta()
-    return data
+    with _meta_cache_lock:
+        _meta_cache[meta_path] = (signature, data)
+    return _copy_meta(data)
 
 
 def _profile_settings_file(profile_id: str) -> str:
@@ -348,9 +377,7 @@ def get_active_profile_id() -> str:
     return str(meta.get("active") or "default")
 
 
-def list_profiles() -> list[dict[str, str]]:
-    ensure_profile_system_initialized()
-    meta = _load_profiles_meta()
+def _profiles_from_meta(meta: dict[str, Any]) -> list[dict[str, str]]:
     out: list[dict[str, str]] = []
     for p in meta.get("profiles", []):
         pid = str(p.get("id", "")).strip()
@@ -363,6 +390,11 @@ def list_profiles() -> list[dict[str, str]]:
     return out
 
 
+def list_profiles() -> list[dict[str, str]]:
+    ensure_profile_system_initialized()
+    return _profiles_from_meta(_load_profiles_meta())
+
+
 def create_profile(name: str) -> dict[str, str]:
     ensure_profile_system_initialized()
     if not _is_valid_profile_name(name):
@@ -512,17 +544,7 @@ def list_scope_profiles(scope: str) -> list[dict[str, str]]:
         return list_profiles()
 
     ensure_scope_initialized(scope_norm)
-    meta = _load_scope_meta(scope_norm)
-    out: list[dict[str, str]] = []
-    for p in meta.get("profiles", []):
-        pid = str(p.get("id", "")).strip()
-        name = str(p.get("name", "")).strip()
-        if not pid or pid == PROFILE_ADD_SENTINEL:
-            continue
-        out.append({"id": pid, "name": name or pid})
-    if not out:
-        out.append({"id": "default", "name": "Default"})
-    return out
+    return _profiles_from_meta(_load_scope_meta(scope_norm))
 
 
 def get_active_scope_profile_id(scope: str) -> str:
@@ -535,6 +557,17 @@ def get_active_scope_profile_id(scope: str) -> str:
     return str(meta.get("active") or "default")
 
 
+def get_scope_profiles_state(scope: str) -> tuple[list[dict[str, str]], str]:
+    scope_norm = _normalize_scope(scope)
+    if scope_norm == "settings":
+        ensure_profile_system_initialized()
+        meta = _load_profiles_meta()
+    else:
+        ensure_scope_initialized(scope_norm)
+        meta = _load_scope_meta(scope_norm)
+    return _profiles_from_meta(meta), str(meta.get("active") or "default")
+
+
 def create_scope_profile(scope: str, name: str) -> dict[str, str]:
     scope_norm = _normalize_scope(scope)
     if scope_norm == "settings":
@@ -653,11 +686,46 @@ def rename_scope_profile(scope: str, profile_id: str, new_name: str) -> bool:
     return True
 
 
+# (versions profiles.json path, its (mtime_ns, size)) -> active versions dir.
+# Almost every version request resolves the clients dir; the full path
+# re-initialises the scope and parses profiles.json twice.
+_active_versions_dir: tuple[tuple[str, tuple[int, int]], str] | None = None
+
+
+def _versions_meta_signature() -> tuple[str, tuple[int, int]] | None:
+    meta_path = os.path.join(get_profiles_root_dir(), "versions", "profiles.json")
+    try:
+        st = os.stat(meta_path)
+    except OSError:
+        return None
+    return meta_path, (st.st_mtime_ns, st.st_size)
+
+
 def get_versions_profile_dir(profile_id: str | None = None) -> str:
+    global _active_versions_dir
+
+    signature = None
+    if profile_id is None:
+        signature = _versions_meta_signature()
+        cached = _active_versions_dir
+        if (
+            signature is not None
+            and cached is not None
+            and cached[0] == signature
+            and os.path.isdir(cached[1])
+        ):
+            return cached[1]
+
     ensure_scope_initialized("versions")
     pid = safe_profile_id(profile_id or get_active_scope_profile_id("versions"))
     path = os.path.join(_get_scope_base_dir("versions"), pid)
     os.makedirs(path, exist_ok=True)
+    if profile_id is None:
+        # Initialisation may have just written profiles.json; key on the
+        # file as it is now.
+        signature = _versions_meta_signature()
+        if signature is not None:
+            _active_versions_dir = (signature, path)
     return path
 
 
@@ -1,16 +1,65 @@
 from __future__ import annotations
 
+import os
+import threading
 import urllib.parse
 
+from core.settings.paths import get_profiles_meta_path
+from core.settings.profiles import get_settings_path
 from core.settings.store import load_global_settings
 
 __all__ = ["apply_url_proxy", "_apply_url_proxy"]
 
 
+# Every download URL goes through apply_url_proxy. Loading the settings means
+# resolving the active profile from profiles.json and copying the whole
+# settings dict, so remember the prefix and only reload it once one of the two
+# files changes on disk.
+_prefix_cache: dict[str, object] = {
+    "meta_sig": None,
+    "settings_path": None,
+    "settings_sig": None,
+    "prefix": "",
+}
+_prefix_cache_lock = threading.Lock()
+
+
+def _stat_signature(path: str) -> tuple[int, int] | None:
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
 def _get_url_proxy_prefix() -> str:
     try:
+        meta_sig = _stat_signature(get_profiles_meta_path())
+        with _prefix_cache_lock:
+            cached = dict(_prefix_cache)
+        if meta_sig is not None and meta_sig == cached["meta_sig"]:
+            settings_path = cached["settings_path"]
+        else:
+            settings_path = get_settings_path()
+        settings_sig = _stat_signature(settings_path)
+        if (
+            settings_sig is not None
+            and meta_sig == cached["meta_sig"]
+            and settings_path == cached["settings_path"]
+            and settings_sig == cached["settings_sig"]
+        ):
+            return cached["prefix"]
+
         cfg = load_global_settings()
-        return str(cfg.get("url_proxy") or "").strip()
+        prefix = str(cfg.get("url_proxy") or "").strip()
+        with _prefix_cache_lock:
+            _prefix_cache.update(
+                meta_sig=meta_sig,
+                settings_path=settings_path,
+                settings_sig=settings_sig,
+                prefix=prefix,
+            )
+        return prefix
     except Exception:
         return ""
 
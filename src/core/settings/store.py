@@ -24,6 +24,10 @@ logger = logging.getLogger(__name__)
 
 SETTINGS_IO_LOCK = threading.RLock()
 
+# Parsed settings per file, keyed by path and validated against the file's
+# (mtime_ns, size) so repeated loads skip the configparser round-trip.
+_SETTINGS_CACHE: dict[str, tuple[tuple[int, int], dict[str, Any]]] = {}
+
 __all__ = [
     "load_global_settings",
     "load_version_data",
@@ -59,18 +63,37 @@ def _normalise_loaded_dict(data: dict[str, Any]) -> dict[str, Any]:
     return merged
 
 
+def _file_signature(path: str) -> tuple[int, int] | None:
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+def _config_to_dict(config: configparser.ConfigParser) -> dict[str, Any]:
+    data: dict[str, Any] = {}
+    for section in config.sections():
+        data.update(dict(config[section]))
+    return data
+
+
 def load_global_settings(profile_id: str | None = None) -> dict[str, Any]:
     with SETTINGS_IO_LOCK:
         resolved_profile_id = profile_id or get_active_profile_id()
         path = get_settings_path(resolved_profile_id)
+        signature = _file_signature(path)
+        cached = _SETTINGS_CACHE.get(path)
+        if signature is not None and cached is not None and cached[0] == signature:
+            return dict(cached[1])
+
         data: dict[str, Any] = {}
 
-        if os.path.exists(path):
+        if signature is not None:
             try:
                 config = configparser.ConfigParser()
                 config.read(path, encoding="utf-8")
-                for section in config.sections():
-                    data.update(dict(config[section]))
+                data = _config_to_dict(config)
             except (configparser.MissingSectionHeaderError, configparser.ParsingError):
                 data = _read_legacy_flat_ini(path)
                 if data:
@@ -79,7 +102,12 @@ def load_global_settings(profile_id: str | None = None) -> dict[str, Any]:
                 logger.warning(f"Failed to parse settings file, using defaults: {e}")
                 data = {}
 
-        return _normalise_loaded_dict(data)
+        loaded = _normalise_loaded_dict(data)
+        if signature is not None:
+            _SETTINGS_CACHE[path] = (signature, loaded)
+        else:
+            _SETTINGS_CACHE.pop(path, None)
+        return dict(loaded)
 
 
 def save_global_settings(
@@ -109,6 +137,15 @@ def save_global_settings(
             for key, value in extras.items():
                 config["launcher"][key] = str(value)
 
+        # Settings forms re-submit unchanged values all the time; when the
+        # result matches what is already on disk there is nothing to write.
+        new_settings = _normalise_loaded_dict(_config_to_dict(config))
+        cached = _SETTINGS_CACHE.get(path)
+        if cached is not None and cached[1] == new_settings:
+            signature = _file_signature(path)
+            if signature is not None and cached[0] == signature:
+                return
+
         os.makedirs(os.path.dirname(path), exist_ok=True)
 
         last_error: Exception | None = None
@@ -118,6 +155,9 @@ def save_global_settings(
                 with open(tmp_path, "w", encoding="utf-8") as f:
                     config.write(f)
                 os.replace(tmp_path, path)
+                signature = _file_signature(path)
+                if signature is not None:
+                    _SETTINGS_CACHE[path] = (signature, new_settings)
                 return
             except PermissionError as e:
                 last_error = e
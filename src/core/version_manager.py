@@ -3,6 +3,7 @@ from __future__ import annotations
 import configparser
 import io
 import os
+import threading
 import time
 from typing import Any, Final
 
@@ -11,6 +12,7 @@ from core.constants import VERSION_SCAN_CACHE_TTL_S
 __all__ = [
     "SUPPORTED_MODLOADER_TYPES",
     "ensure_loaders_dir",
+    "find_installed_version_dir",
     "get_clients_dir",
     "get_loaders_dir",
     "get_version_loaders",
@@ -36,6 +38,14 @@ _VALID_STORAGE_OVERRIDE_MODES: Final[frozenset[str]] = frozenset(
 
 _cache: dict[str, list[dict[str, Any]]] | None = None
 _cache_ts: float = 0.0
+_cache_scanned_at: float = 0.0
+_cache_signature: tuple | None = None
+# (category.casefold(), folder) -> absolute version dir, for the clients dir
+# the current cache was scanned from.
+_cache_dirs: tuple[str, dict[tuple[str, str], str]] = ("", {})
+# A page load fires several API calls at once; serialise the revalidation so
+# they share one directory walk instead of each doing their own.
+_scan_lock = threading.Lock()
 
 
 def _settings():
@@ -186,11 +196,12 @@ def _build_version_entry(
     }
 
 
-def _scan_once() -> dict[str, list[dict[str, Any]]]:
+def _scan_once() -> tuple[dict[str, list[dict[str, Any]]], tuple[str, dict[tuple[str, str], str]]]:
     clients_dir = get_clients_dir()
     results: dict[str, list[dict[str, Any]]] = {}
+    dirs: dict[tuple[str, str], str] = {}
     if not os.path.isdir(clients_dir):
-        return results
+        return results, (clients_dir, dirs)
 
     base_dir = _settings().get_base_dir()
 
@@ -211,23 +222,87 @@ def _scan_once() -> dict[str, list[dict[str, Any]]]:
                     base_dir=base_dir, category=category, version=version, vpath=vpath
                 )
             )
+            dirs.setdefault((category.casefold(), version), vpath)
 
     all_versions: list[dict[str, Any]] = []
     for vers in results.values():
         all_versions.extend(vers)
     all_versions.sort(key=lambda v: (v.get("category", ""), v.get("folder", "")))
     results["* All"] = all_versions
-    return results
+    return results, (clients_dir, dirs)
 
 
-def scan_categories(force_refresh: bool = False) -> dict[str, list[dict[str, Any]]]:
-    global _cache, _cache_ts
+def _scan_signature(clients_dir: str) -> tuple | None:
+    # Adding, removing or renaming a category or version bumps its parent's
+    # mtime. Installs create the version dir first and write data.ini only
+    # when they finish, and nothing notifies the scan when that happens, so
+    # each version's data.ini is stamped as well.
+    try:
+        stamps = [os.stat(clients_dir).st_mtime_ns]
+        with os.scandir(clients_dir) as it:
+            categories = [entry for entry in it if entry.is_dir()]
+        for category in categories:
+            versions = []
+            with os.scandir(category.path) as it:
+                for entry in it:
+                    if not entry.is_dir():
+                        continue
+                    try:
+                        st = os.stat(os.path.join(entry.path, "data.ini"))
+                        versions.append((entry.name, st.st_mtime_ns, st.st_size))
+                    except OSError:
+                        versions.append((entry.name, None, None))
+            versions.sort()
+            stamps.append((category.name, category.stat().st_mtime_ns, tuple(versions)))
+    except OSError:
+        return None
+    stamps[1:] = sorted(stamps[1:])
+    return (clients_dir, tuple(stamps))
 
-    now = time.time()
-    if force_refresh or _cache is None or (now - _cache_ts) > VERSION_SCAN_CACHE_TTL_S:
-        _cache = _scan_once()
+
+def scan_categories(force_refresh: bool = False) -> dict[str, list[dict[str, Any]]]:
+    global _cache, _cache_ts, _cache_scanned_at, _cache_signature, _cache_dirs
+
+    requested_at = time.time()
+    if (
+        not force_refresh
+        and _cache is not None
+        and (requested_at - _cache_ts) <= VERSION_SCAN_CACHE_TTL_S
+    ):
+        return _cache
+
+    with _scan_lock:
+        now = time.time()
+        if force_refresh:
+            # Another caller may have rescanned while we waited for the lock.
+            fresh = _cache is not None and _cache_scanned_at >= requested_at
+        else:
+            fresh = _cache is not None and (now - _cache_ts) <= VERSION_SCAN_CACHE_TTL_S
+        if fresh:
+            return _cache
+
+        signature = _scan_signature(get_clients_dir())
+        if force_refresh or _cache is None or signature is None or signature != _cache_signature:
+            _cache, _cache_dirs = _scan_once()
+            _cache_signature = signature
+            _cache_scanned_at = now
         _cache_ts = now
-    return _cache or {}
+        return _cache or {}
+
+
+def find_installed_version_dir(category: str, folder: str) -> str | None:
+    """Look up an installed version's directory from the scan cache.
+
+    Never scans: returns None unless a scan from the current versions profile
+    is still within its TTL and lists the version; callers fall back to the
+    disk.
+    """
+    if _cache is None or (time.time() - _cache_ts) > VERSION_SCAN_CACHE_TTL_S:
+        return None
+    clients_dir, dirs = _cache_dirs
+    if clients_dir != get_clients_dir():
+        return None
+    return dirs.get((str(category or "").strip().casefold(), str(folder or "")))
 
 
 def get_version_loaders(category: str, folder: str) -> dict[str, list[dict[str, Any]]]:
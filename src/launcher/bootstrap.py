@@ -2,7 +2,6 @@ from __future__ import annotations
 
 import importlib
 import os
-import random
 import shutil
 import subprocess
 import sys
@@ -30,6 +29,7 @@ from launcher.dialogs import (
 from launcher.i18n import set_temporary_language, suggested_language_code, t
 from launcher.pip_installer import install
 from launcher.prompts import (
+    PromptDialogHost,
     prompt_create_shortcut,
     prompt_beta_warning,
     prompt_new_user,
@@ -46,7 +46,6 @@ from launcher.webview_runner import (
     control_panel_fallback_window,
     open_in_browser,
     open_with_webview,
-    wait_for_server,
 )
 
 
@@ -64,35 +63,32 @@ _RUNTIME_MODULE_PREFIXES = (
 if not sys.platform.startswith("linux"):
     _RUNTIME_MODULE_PREFIXES += ("plyer",)
 
+# Imported lazily further down main(); loading them on a side thread lets the
+# work overlap with the splash, dependency probing and the update check.
+_WARM_IMPORT_MODULES = (
+    "server.http",
+    "server.api.dispatch",
+    "server.yggdrasil",
+)
+
 
-def _start_local_server_with_retry(
-    *,
-    min_port: int = 10000,
-    max_port: int = 20000,
-    attempts: int = 30,
-):
+def _start_local_server():
+    from server.api.version_check import prefetch_launcher_outdated
     from server.http import start_server
 
-    tried_ports: set[int] = set()
-    last_error: Exception | None = None
+    server = start_server(0)
+    # The UI asks whether the launcher is outdated right after its first
+    # paint; get the GitHub round trip out of the way while it loads.
+    prefetch_launcher_outdated()
+    return server.server_address[1], server
 
-    for _ in range(max(1, int(attempts))):
-        port = random.randint(min_port, max_port)
-        if port in tried_ports:
-            continue
-        tried_ports.add(port)
 
+def _warm_imports() -> None:
+    for name in _WARM_IMPORT_MODULES:
         try:
-            server = start_server(port)
-            return port, server
-        except OSError as exc:
-            last_error = exc
-            safe_print(
-                f"[launcher] Local server port {port} unavailable: {exc}"
-            )
-
-    detail = f": {last_error}" if last_error else ""
-    raise RuntimeError(f"Could not bind local launcher server{detail}")
+            importlib.import_module(name)
+        except Exception:
+            pass
 
 
 def _reconfigure_std_streams() -> None:
@@ -182,6 +178,14 @@ def show_disclaimer_if_needed() -> None:
 
 
 def check_and_prompt(splash=None):
+    host = PromptDialogHost(splash)
+    try:
+        return _check_and_prompt(splash, host)
+    finally:
+        host.close()
+
+
+def _check_and_prompt(splash, host):
     from server.api.version_check import read_local_version
 
     local = read_local_version(base_dir=PROJECT_ROOT)
@@ -196,7 +200,7 @@ def check_and_prompt(splash=None):
     )
     if not DATA_FILE_EXISTS:
         safe_print("[launcher] PROMPTING NEW USER...")
-        open_instructions = prompt_new_user()
+        open_instructions = prompt_new_user(parent=host.parent())
         safe_print(
             f"[launcher] prompt_user_update[user_accepted]: "
             f"{open_instructions}"
@@ -222,7 +226,9 @@ def check_and_prompt(splash=None):
         if sys.platform.startswith("win") or sys.platform.startswith("linux"):
             try:
                 safe_print("[launcher] PROMPTING SHORTCUT SETUP...")
-                create_shortcut = prompt_create_shortcut()
+                create_shortcut = prompt_create_shortcut(
+                    parent=host.parent()
+                )
                 safe_print(
                     f"[launcher] prompt_create_shortcut[user_accepted]: "
                     f"{create_shortcut}"
@@ -234,11 +240,13 @@ def check_and_prompt(splash=None):
                         show_custom_info(
                             t("native.prompts.shortcutCreatedTitle"),
                             t("native.prompts.shortcutCreatedMessage"),
+                            parent=host.parent(),
                         )
                     else:
                         show_custom_error(
                             t("native.prompts.shortcutErrorTitle"),
                             t("native.prompts.shortcutErrorMessage"),
+                            parent=host.parent(),
                         )
             except Exception as e:
                 safe_print(
@@ -254,7 +262,7 @@ def check_and_prompt(splash=None):
     )
     if promptb:
         safe_print("[launcher] PROMPTING BETA WARNING...")
-        prompt_beta_warning(local)
+        prompt_beta_warning(local, parent=host.parent())
 
     promptu, reasonu = should_prompt_update(local, remote)
     safe_print(f"[launcher] should_prompt_update[prompt]: {promptu}")
@@ -266,7 +274,9 @@ def check_and_prompt(splash=None):
         )
     if promptu and release_info:
         safe_print("[launcher] PROMPTING USER UPDATE...")
-        open_update = prompt_user_update(local, remote)
+        open_update = prompt_user_update(
+            local, remote, parent=host.parent()
+        )
         safe_print(
             f"[launcher] prompt_user_update[user_accepted]: {open_update}"
         )
@@ -279,6 +289,7 @@ def check_and_prompt(splash=None):
                     show_custom_info(
                         t("native.prompts.updateInstalledTitle"),
                         t("native.prompts.updateInstalledMessage"),
+                        parent=host.parent(),
                     )
                 except Exception:
                     pass
@@ -305,6 +316,7 @@ def check_and_prompt(splash=None):
                 show_custom_error(
                     t("native.prompts.updateFailedTitle"),
                     t("native.prompts.updateFailedMessage"),
+                    parent=host.parent(),
                 )
             except Exception:
                 pass
@@ -602,6 +614,13 @@ def main():
             "[installation] Falling back to browser mode."
         )
 
+    # Start only now: the server packages import core.* and server.api, which
+    # the steps above load on this thread, and concurrent first imports of
+    # mutually dependent packages can see half-initialised modules.
+    threading.Thread(
+        target=_warm_imports, name="launcher-warm-imports", daemon=True
+    ).start()
+
     safe_print(dim_line("------------------------------------------------"))
 
     try:
@@ -628,7 +647,7 @@ def main():
 
     safe_print("[launcher] Starting local server...")
     try:
-        port, local_server = _start_local_server_with_retry()
+        port, local_server = _start_local_server()
     except Exception as e:
         safe_print(
             f"[launcher] Failed to start local server: {e}"
@@ -659,22 +678,6 @@ def main():
         )
     except Exception:
         pass
-    url = f"http://127.0.0.1:{port}/"
-
-    if not wait_for_server(url, timeout=5.0, on_poll=splash.pump):
-        safe_print(
-            "[launcher] Server did not respond within timeout; something has "
-            "failed! Exiting launcher..."
-        )
-        splash.close(ensure_minimum=False)
-        try:
-            local_server.shutdown()
-            local_server.server_close()
-        except Exception:
-            pass
-        if discord_rpc is not None:
-            discord_rpc.stop_discord_rpc()
-        return
 
     safe_print(dim_line("------------------------------------------------"))
     if discord_rpc is not None:
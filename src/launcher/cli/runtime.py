@@ -19,8 +19,6 @@ _BANNER_TAG = "Histolauncher CLI"
 
 
 def _start_local_server(state: CliState, *, verbose: bool = True) -> bool:
-    import random
-
     try:
         from server.http import start_server
     except Exception as exc:
@@ -29,25 +27,14 @@ def _start_local_server(state: CliState, *, verbose: bool = True) -> bool:
             print_error(state.server_error)
         return False
 
-    last_error: Exception | None = None
-    port: int | None = None
-    server: object | None = None
-    for _ in range(30):
-        candidate = random.randint(10000, 20000)
-        try:
-            server = start_server(candidate)
-            port = candidate
-            break
-        except OSError as exc:
-            last_error = exc
-            continue
-
-    if port is None or server is None:
-        detail = f": {last_error}" if last_error else ""
-        state.server_error = f"Could not bind local launcher server{detail}"
+    try:
+        server = start_server(0)
+    except OSError as exc:
+        state.server_error = f"Could not bind local launcher server: {exc}"
         if verbose:
             print_error(state.server_error)
         return False
+    port = server.server_address[1]
 
     state.server_port = port
     state.server = server
@@ -67,13 +54,6 @@ def _start_local_server(state: CliState, *, verbose: bool = True) -> bool:
     except Exception:
         pass
 
-    try:
-        from launcher.webview_runner import wait_for_server
-
-        wait_for_server(f"http://127.0.0.1:{port}/", timeout=5.0)
-    except Exception:
-        pass
-
     if state.debug and verbose:
         print_info(f"Local server listening on port {port}.")
     return True
@@ -41,6 +41,8 @@ _PIP_PHASES = {
     "successfully installed": 1.0,
 }
 
+_LOG_FLUSH_INTERVAL_MS = 100
+
 
 def install(package, *, display_name: str | None = None):
     if isinstance(package, str):
@@ -63,10 +65,9 @@ def install(package, *, display_name: str | None = None):
     collapsed_size = (600, 220)
     expanded_size = (600, 410)
 
-    def detect_phase_fraction(line):
-        l = line.lower()
+    def detect_phase_fraction(lowered_line):
         for key, frac in _PIP_PHASES.items():
-            if key in l:
+            if key in lowered_line:
                 return frac
         return None
 
@@ -78,21 +79,52 @@ def install(package, *, display_name: str | None = None):
     direction = tk_direction_options()
     drag_state = {"x": 0, "y": 0}
 
+    # pip can emit thousands of lines; collect them and insert into the text
+    # widget in one batch per flush interval instead of once per line.
+    log_state = {"pending": [], "scheduled": False, "lock": threading.Lock()}
+    ui_state = {"status": None, "progress": None}
+
+    def flush_log():
+        with log_state["lock"]:
+            chunk = "".join(log_state["pending"])
+            log_state["pending"].clear()
+            log_state["scheduled"] = False
+        if not chunk:
+            return
+        try:
+            output_box.configure(state="normal")
+            output_box.insert("end", chunk)
+            output_box.see("end")
+            output_box.configure(state="disabled")
+        except tkinter.TclError:
+            pass
+
     def ui_log(line):
-        output_box.configure(state="normal")
-        output_box.insert("end", line)
-        output_box.see("end")
-        output_box.configure(state="disabled")
+        with log_state["lock"]:
+            log_state["pending"].append(line)
+            if log_state["scheduled"]:
+                return
+            log_state["scheduled"] = True
+        queue_ui(lambda: root.after(_LOG_FLUSH_INTERVAL_MS, flush_log))
 
     def ui_set_status(text):
+        if ui_state["status"] == text:
+            return
+        ui_state["status"] = text
         progress_label.config(text=text)
 
     def ui_set_progress(value):
-        progress.config(mode="determinate", maximum=100)
-        progress.stop()
-        progress["value"] = max(0, min(100, value))
+        value = max(0, min(100, value))
+        if ui_state["progress"] is None:
+            progress.config(mode="determinate", maximum=100)
+            progress.stop()
+        elif ui_state["progress"] == value:
+            return
+        ui_state["progress"] = value
+        progress["value"] = value
 
     def ui_finish(success):
+        flush_log()
         ui_set_status(
             t("native.install.statusFinished")
             if success
@@ -155,20 +187,21 @@ def install(package, *, display_name: str | None = None):
         except OSError as e:
             msg = f"[installation] pip launch failed with {py}: {e}\n"
             safe_print(msg.rstrip())
-            queue_ui(lambda m=msg: ui_log(m))
+            ui_log(msg)
             return 127, msg
         collected: list[str] = []
         stream = process.stdout if process.stdout is not None else []
         for line in stream:
             collected.append(line)
             safe_print(f"[pip] {line.rstrip()}")
-            queue_ui(lambda line=line: ui_log(line))
-            if line.lower().startswith("collecting "):
+            ui_log(line)
+            lowered = line.lower()
+            if lowered.startswith("collecting "):
                 total_packages += 1
                 queue_ui(lambda: ui_set_status(t("native.install.statusCollecting")))
-            phase_frac = detect_phase_fraction(line)
+            phase_frac = detect_phase_fraction(lowered)
             if phase_frac is not None and total_packages > 0:
-                if "successfully installed" in line.lower():
+                if "successfully installed" in lowered:
                     completed_packages += 1
                     queue_ui(lambda: ui_set_status(t("native.install.statusPackages")))
                 overall = (
@@ -192,7 +225,7 @@ def install(package, *, display_name: str | None = None):
 
         def venv_log(msg: str) -> None:
             safe_print(msg)
-            queue_ui(lambda m=msg: ui_log(m + "\n"))
+            ui_log(msg + "\n")
 
         def target_site_packages() -> str:
             existing = get_venv_site_packages()
@@ -244,15 +277,15 @@ def install(package, *, display_name: str | None = None):
                     return 0
             return last_rc
 
-        queue_ui(lambda: ui_log(
+        ui_log(
             "\n[installer] Installing into launcher venv at "
             "~/.histolauncher/venv ...\n\n"
-        ))
+        )
         venv_py = get_venv_python()
         if not ensure_venv(log=venv_log):
-            queue_ui(lambda: ui_log(
+            ui_log(
                 "\n[installer] Could not create a complete launcher venv.\n"
-            ))
+            )
             return try_installed_python_target_install(venv_py)
 
         if sys.platform.startswith("win"):
@@ -294,10 +327,10 @@ def install(package, *, display_name: str | None = None):
             override_env["PIP_BREAK_SYSTEM_PACKAGES"] = "1"
             attempts.append(override_env)
 
-        queue_ui(lambda: ui_log(
+        ui_log(
             "\n[installer] pip is missing. Attempting to bootstrap with "
             "ensurepip...\n"
-        ))
+        )
 
         last_output = ""
         for env in attempts:
@@ -320,7 +353,7 @@ def install(package, *, display_name: str | None = None):
             output_lines = (proc.stdout or "").splitlines() + (proc.stderr or "").splitlines()
             for line in output_lines:
                 safe_print(f"[ensurepip] {line}")
-                queue_ui(lambda line=line: ui_log(line + "\n"))
+                ui_log(line + "\n")
             safe_print(
                 f"[installation] ensurepip exited with code {proc.returncode}"
             )
@@ -357,16 +390,16 @@ def install(package, *, display_name: str | None = None):
             returncode = _try_venv_install()
 
             if returncode != 0 and not _venv_available():
-                queue_ui(lambda: ui_log(
+                ui_log(
                     "\n[installer] venv unavailable; falling back to system pip...\n\n"
-                ))
+                )
                 returncode, output = _run_pip([])
 
                 if returncode != 0 and "no module named pip" in output.lower():
                     if _bootstrap_pip():
-                        queue_ui(lambda: ui_log(
+                        ui_log(
                             "\n[installer] pip bootstrapped. Retrying install...\n\n"
-                        ))
+                        )
                         returncode, output = _run_pip([])
                     else:
                         hint = _linux_distro_pip_hint() if sys.platform.startswith("linux") else ""
@@ -378,28 +411,24 @@ def install(package, *, display_name: str | None = None):
                             msg += f"Install pip manually with:\n{hint}\n"
                         msg += "Then restart Histolauncher and try again.\n"
                         safe_print(msg.rstrip())
-                        queue_ui(lambda m=msg: ui_log(m))
+                        ui_log(msg)
 
                 if (
                     returncode != 0
                     and "externally-managed" in output.lower()
                     and not sys.platform.startswith("win")
                 ):
-                    queue_ui(lambda: ui_log(
+                    ui_log(
                         "\n[installer] Externally-managed Python environment detected.\n"
                         "Retrying with --break-system-packages...\n\n"
-                    ))
+                    )
                     returncode, output = _run_pip(["--break-system-packages"])
 
             result["success"] = returncode == 0
             queue_ui(lambda success=result["success"]: ui_finish(success))
         except Exception as e:
             result["success"] = False
-            queue_ui(
-                lambda err=e: ui_log(
-                    "\n" + t("native.install.errorPrefix", {"error": err}) + "\n"
-                )
-            )
+            ui_log("\n" + t("native.install.errorPrefix", {"error": e}) + "\n")
             queue_ui(lambda: ui_set_status(t("native.install.statusFailed")))
         finally:
             queue_ui(lambda: root.after(300, close_dialog))
@@ -1,14 +1,17 @@
 from __future__ import annotations
 
+from launcher._constants import ICO_PATH
 from launcher.dialogs import (
     ask_custom_okcancel,
     ask_custom_yesno,
+    resolve_dialog_owner,
     show_custom_warning,
 )
 from launcher.i18n import t
 
 
 __all__ = [
+    "PromptDialogHost",
     "prompt_create_shortcut",
     "prompt_new_user",
     "prompt_user_update",
@@ -16,29 +19,80 @@ __all__ = [
 ]
 
 
-def prompt_create_shortcut():
+class PromptDialogHost:
+    """Hidden Tk owner shared by every startup prompt.
+
+    Without a live owner each dialog spins up (and tears down) its own Tcl
+    interpreter, so a run of prompts pays the Tk init cost once per dialog.
+    The host reuses the splash root while it is alive and otherwise creates
+    a single withdrawn root on first use, destroyed by ``close()``.
+    """
+
+    def __init__(self, splash=None):
+        self._splash = splash
+        self._root = None
+        self._owned = False
+
+    def parent(self):
+        for candidate in (self._root, getattr(self._splash, "root", None)):
+            if candidate is None:
+                continue
+            try:
+                if candidate.winfo_exists():
+                    self._root = candidate
+                    return candidate
+            except Exception:
+                pass
+
+        if self._owned:
+            self.close()
+
+        root, owned = resolve_dialog_owner()
+        if owned:
+            try:
+                root.iconbitmap(ICO_PATH)
+            except Exception:
+                pass
+        self._root = root
+        self._owned = owned
+        return root
+
+    def close(self):
+        root, owned = self._root, self._owned
+        self._root = None
+        self._owned = False
+        if root is not None and owned:
+            try:
+                root.destroy()
+            except Exception:
+                pass
+
+
+def prompt_create_shortcut(parent=None):
     try:
         return ask_custom_yesno(
             t("native.prompts.createShortcutTitle"),
             t("native.prompts.createShortcutMessage"),
+            parent=parent,
             kind="question",
         )
     except Exception:
         return False
 
 
-def prompt_new_user():
+def prompt_new_user(parent=None):
     try:
         return ask_custom_okcancel(
             t("native.prompts.newUserTitle"),
             t("native.prompts.newUserMessage"),
+            parent=parent,
             kind="question",
         )
     except Exception:
         return False
 
 
-def prompt_user_update(local, remote):
+def prompt_user_update(local, remote, parent=None):
     try:
         return ask_custom_yesno(
             t("native.prompts.updateAvailableTitle"),
@@ -46,17 +100,19 @@ def prompt_user_update(local, remote):
                 "native.prompts.updateAvailableMessage",
                 {"local": local, "remote": remote},
             ),
+            parent=parent,
             kind="question",
         )
     except Exception:
         return False
 
 
-def prompt_beta_warning(local):
+def prompt_beta_warning(local, parent=None):
     try:
         show_custom_warning(
             t("native.prompts.betaWarningTitle"),
             t("native.prompts.betaWarningMessage", {"local": local}),
+            parent=parent,
         )
         return True
     except Exception:
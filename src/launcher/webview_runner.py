@@ -1,8 +1,6 @@
 from __future__ import annotations
 
-import time
 import tkinter
-import urllib.request
 import webbrowser
 from tkinter import ttk
 
@@ -19,31 +17,12 @@ from launcher.win32_icon import extract_pywebview_hwnd, replace_pywebview_icon
 
 
 __all__ = [
-    "wait_for_server",
     "open_in_browser",
     "open_with_webview",
     "control_panel_fallback_window",
 ]
 
 
-def wait_for_server(url, timeout=5.0, poll_interval=0.05, on_poll=None):
-    deadline = time.time() + timeout
-    while time.time() < deadline:
-        if on_poll is not None:
-            try:
-                on_poll()
-            except Exception:
-                pass
-        try:
-            with urllib.request.urlopen(url, timeout=0.5) as resp:
-                if resp.status in (200, 301, 302, 304):
-                    return True
-        except Exception:
-            pass
-        time.sleep(poll_interval)
-    return False
-
-
 def open_in_browser(port):
     url = f"http://127.0.0.1:{port}/"
     try:
@@ -25,6 +25,11 @@ from core.constants import (
 __all__ = [
     "GITHUB_RAW_VERSION_URL",
     "REMOTE_TIMEOUT",
+    "REMOTE_VERSION_CACHE_TTL_S",
+    "REMOTE_VERSION_MAX_BYTES",
+    "REMOVE_TREE_PARALLEL_MIN_FILES",
+    "REMOVE_TREE_WORKERS",
+    "MAX_STATUS_BULK_KEYS",
     "MAX_VERSION_ID_LENGTH",
     "MAX_CATEGORY_LENGTH",
     "MAX_USERNAME_LENGTH",
@@ -64,6 +69,13 @@ GITHUB_RAW_VERSION_URL = (
     "https://raw.githubusercontent.com/KerbalOfficial/Histolauncher/main/version.dat"
 )
 REMOTE_TIMEOUT = 5.0
+REMOTE_VERSION_CACHE_TTL_S = 5 * 60
+REMOTE_VERSION_MAX_BYTES = 64
+
+REMOVE_TREE_PARALLEL_MIN_FILES = 256
+REMOVE_TREE_WORKERS = 8
+
+MAX_STATUS_BULK_KEYS = 64
 
 MAX_PAYLOAD_SIZE = MAX_VERSIONS_IMPORT_PAYLOAD
 
@@ -3,6 +3,10 @@ from __future__ import annotations
 import json
 import os
 import re
+import shutil
+import stat
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Dict
 
 from core import modloaders as core_modloaders
@@ -12,10 +16,12 @@ from core.settings import (
     normalize_storage_directory_mode,
     validate_custom_storage_directory,
 )
-from core.version_manager import get_clients_dir
+from core.version_manager import find_installed_version_dir, get_clients_dir
 
 from server.api._constants import (
     CANCELLED_OPERATION_ERROR_MESSAGE,
+    REMOVE_TREE_PARALLEL_MIN_FILES,
+    REMOVE_TREE_WORKERS,
     VALID_VERSION_STORAGE_OVERRIDE_MODES,
 )
 from server.api._state import STATE, CancelledOperationError
@@ -30,6 +36,7 @@ __all__ = [
     "_write_data_ini_file",
     "_is_path_within",
     "_resolve_version_dir_secure",
+    "_remove_tree",
     "_normalize_version_storage_override_mode",
     "_sanitize_settings_payload",
     "_prepare_settings_response",
@@ -152,6 +159,14 @@ def _is_path_within(root: str, target: str) -> bool:
 
 def _resolve_version_dir_secure(category: str, folder: str) -> Dict[str, str]:
     clients_dir = get_clients_dir()
+
+    # Versions from the last scan are known directories; only unknown ones
+    # need the listdir/isdir walk below. Both still get the containment check.
+    cached = find_installed_version_dir(category, folder)
+    if cached:
+        if not _is_path_within(clients_dir, cached):
+            return {"ok": False, "error": "invalid version path", "path": ""}
+        return {"ok": True, "error": "", "path": cached}
     matched_category = ""
     try:
         for cat_name in os.listdir(clients_dir):
@@ -175,6 +190,75 @@ def _resolve_version_dir_secure(category: str, folder: str) -> Dict[str, str]:
     return {"ok": True, "error": "", "path": version_dir}
 
 
+def _unlink_writable(path: str) -> None:
+    try:
+        os.unlink(path)
+    except PermissionError:
+        # Read-only files (common in extracted jars/natives on Windows) refuse
+        # unlink until the bit is cleared.
+        os.chmod(path, stat.S_IWRITE)
+        os.unlink(path)
+
+
+def _retry_writable(func, path, _exc) -> None:
+    os.chmod(path, stat.S_IWRITE)
+    func(path)
+
+
+def _is_link_entry(entry: os.DirEntry) -> bool:
+    # Junctions (and other reparse points) report is_dir(follow_symlinks=False)
+    # on Windows; recursing would delete whatever they point at, which may be
+    # shared data outside the version folder. Remove the link itself instead.
+    if entry.is_symlink():
+        return True
+    is_junction = getattr(entry, "is_junction", None)
+    if is_junction is not None and is_junction():
+        return True
+    attributes = getattr(entry.stat(follow_symlinks=False), "st_file_attributes", 0)
+    return bool(attributes & getattr(stat, "FILE_ATTRIBUTE_REPARSE_POINT", 0))
+
+
+def _remove_tree(path: str) -> None:
+    """Delete ``path`` recursively, unlinking large file sets in parallel.
+
+    Version folders can hold tens of thousands of small files; unlink releases
+    the GIL, so spreading it over a few threads keeps deletes from dominating
+    the request. Symlinks and junctions are unlinked, never descended into.
+    Anything unexpected falls back to ``shutil.rmtree``.
+    """
+    try:
+        files: list[str] = []
+        dirs: list[str] = []
+        pending = [path]
+        while pending:
+            current = pending.pop()
+            dirs.append(current)
+            with os.scandir(current) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False) and not _is_link_entry(entry):
+                        pending.append(entry.path)
+                    else:
+                        files.append(entry.path)
+
+        if len(files) >= REMOVE_TREE_PARALLEL_MIN_FILES:
+            with ThreadPoolExecutor(max_workers=REMOVE_TREE_WORKERS) as executor:
+                for _ in executor.map(_unlink_writable, files):
+                    pass
+        else:
+            for file_path in files:
+                _unlink_writable(file_path)
+
+        # Parents were recorded before their children.
+        for dir_path in reversed(dirs):
+            os.rmdir(dir_path)
+    except OSError:
+        if os.path.lexists(path):
+            if sys.version_info >= (3, 12):
+                shutil.rmtree(path, onexc=_retry_writable)
+            else:
+                shutil.rmtree(path, onerror=_retry_writable)
+
+
 def _normalize_version_storage_override_mode(value: Any) -> str:
     mode = str(value or "default").strip().lower()
     if mode in VALID_VERSION_STORAGE_OVERRIDE_MODES:
@@ -438,5 +522,5 @@ def _format_bytes(bytes_size: int) -> str:
 
 
 def _extract_category(path: str) -> str:
-    parts = path.split("/api/versions", 1)[1].lstrip("/").split("/")
-    return parts[0] if parts and parts[0] else None
+    rest = path.partition("/api/versions")[2].lstrip("/")
+    return rest.partition("/")[0] or None
@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+import threading
+from typing import Any, Callable, Iterable
+
+
+__all__ = [
+    "SEARCH_FIELD_SEPARATOR",
+    "SubstringIndex",
+    "get_search_index",
+]
+
+
+# Joins the searchable fields of one entry into a single haystack; it never
+# appears in a stripped user query, so a match cannot span two fields.
+SEARCH_FIELD_SEPARATOR = "\x1f"
+
+_TRIGRAM = 3
+
+
+def _trigrams(text: str) -> set[str]:
+    return {text[i:i + _TRIGRAM] for i in range(len(text) - _TRIGRAM + 1)}
+
+
+class SubstringIndex:
+    """Trigram posting lists over a fixed list of lower-cased haystacks.
+
+    ``search`` returns the positions of every haystack containing each
+    whitespace-separated token of the query, in their original order. Tokens
+    of three characters or more only look at entries sharing all of their
+    trigrams; shorter ones scan linearly over the remaining candidates.
+    """
+
+    __slots__ = ("_haystacks", "_postings")
+
+    def __init__(self, haystacks: Iterable[str]):
+        self._haystacks: list[str] = list(haystacks)
+        postings: dict[str, set[int]] = {}
+        for idx, text in enumerate(self._haystacks):
+            for gram in _trigrams(text):
+                postings.setdefault(gram, set()).add(idx)
+        self._postings = postings
+
+    def __len__(self) -> int:
+        return len(self._haystacks)
+
+    def search(self, query: str) -> list[int]:
+        tokens = query.split()
+        if not tokens:
+            return []
+
+        # Narrow with the longest tokens first: they have the most trigrams.
+        tokens.sort(key=len, reverse=True)
+        candidates: set[int] | None = None
+        for token in tokens:
+            if len(token) < _TRIGRAM:
+                continue
+            for gram in sorted(_trigrams(token), key=lambda g: len(self._postings.get(g, ()))):
+                posting = self._postings.get(gram)
+                if not posting:
+                    return []
+                candidates = set(posting) if candidates is None else candidates & posting
+                if not candidates:
+                    return []
+
+        haystacks = self._haystacks
+        pool = range(len(haystacks)) if candidates is None else sorted(candidates)
+        return [i for i in pool if all(token in haystacks[i] for token in tokens)]
+
+
+_index_cache: dict[str, tuple[Any, SubstringIndex]] = {}
+_index_cache_lock = threading.Lock()
+
+
+def get_search_index(
+    name: str,
+    source: Any,
+    build_haystacks: Callable[[Any], Iterable[str]],
+) -> SubstringIndex:
+    """Return the index for ``source``, rebuilding it only when ``source`` changed.
+
+    ``source`` is compared by identity: the version scan and manifest caches hand
+    back the same list object until they refresh, so a new object means new data.
+    """
+    with _index_cache_lock:
+        cached = _index_cache.get(name)
+        if cached is not None and cached[0] is source:
+            return cached[1]
+
+    index = SubstringIndex(build_haystacks(source))
+    with _index_cache_lock:
+        _index_cache[name] = (source, index)
+    return index
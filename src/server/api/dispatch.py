@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from typing import Any
-from urllib.parse import parse_qs, urlparse
+from urllib.parse import parse_qs
 
 from server.api._helpers import _extract_category
 from server.api.routes.account import (
@@ -45,6 +45,7 @@ from server.api.routes.installer import (
     api_pause,
     api_resume,
     api_status,
+    api_status_bulk,
 )
 from server.api.routes.java import (
     api_java_download,
@@ -158,7 +159,7 @@ __all__ = ["handle_api_request"]
 
 def _query_flag(path: str, name: str) -> bool:
     try:
-        values = parse_qs(urlparse(path).query or "").get(name) or []
+        values = parse_qs(path.partition("?")[2]).get(name) or []
     except Exception:
         return False
     if not values:
@@ -168,7 +169,7 @@ def _query_flag(path: str, name: str) -> bool:
 
 def _query_value(path: str, name: str) -> str:
     try:
-        values = parse_qs(urlparse(path).query or "").get(name) or []
+        values = parse_qs(path.partition("?")[2]).get(name) or []
     except Exception:
         return ""
     if not values:
@@ -176,167 +177,172 @@ def _query_value(path: str, name: str) -> str:
     return str(values[-1] or "").strip()
 
 
-def handle_api_request(path: str, data: Any):
-    p = path.split("?", 1)[0].rstrip("/")
-
-    EXACT_NO_PARAMS = {
-        "/api/account/status": api_account_status,
-        "/api/account/current": api_account_current,
-        "/api/account/settings-iframe": api_account_settings_iframe,
-        "/api/account/launcher-message": api_account_launcher_message,
-        "/api/account/disconnect": api_account_disconnect,
-        "/api/account/microsoft/device-code": api_account_microsoft_device_code,
-        "/api/account/microsoft/textures": api_account_microsoft_textures,
-        "/api/profiles": api_profiles,
-        "/api/profiles/versions": api_profiles_versions,
-        "/api/profiles/mods": api_profiles_mods,
-        "/api/is-launcher-outdated": is_launcher_outdated,
-        "/api/initial": api_initial,
-        "/api/clear-logs": api_clear_logs,
-        "/api/installed": api_installed,
-        "/api/open_data_folder": api_open_data_folder,
-        "/api/corrupted-versions": api_corrupted_versions,
-        "/api/java-install-options": api_java_install_options,
-        "/api/java-runtimes": api_java_runtimes,
-        "/api/java-runtimes-refresh": api_java_runtimes_refresh,
-        "/api/mods/installed": api_mods_installed,
-        "/api/mods/version-options": api_mods_version_options,
-        "/api/modpacks/installed": api_modpacks_installed,
-    }
+_EXACT_NO_PARAMS = {
+    "/api/account/status": api_account_status,
+    "/api/account/current": api_account_current,
+    "/api/account/settings-iframe": api_account_settings_iframe,
+    "/api/account/launcher-message": api_account_launcher_message,
+    "/api/account/disconnect": api_account_disconnect,
+    "/api/account/microsoft/device-code": api_account_microsoft_device_code,
+    "/api/account/microsoft/textures": api_account_microsoft_textures,
+    "/api/profiles": api_profiles,
+    "/api/profiles/versions": api_profiles_versions,
+    "/api/profiles/mods": api_profiles_mods,
+    "/api/is-launcher-outdated": is_launcher_outdated,
+    "/api/initial": api_initial,
+    "/api/clear-logs": api_clear_logs,
+    "/api/installed": api_installed,
+    "/api/open_data_folder": api_open_data_folder,
+    "/api/corrupted-versions": api_corrupted_versions,
+    "/api/java-install-options": api_java_install_options,
+    "/api/java-runtimes": api_java_runtimes,
+    "/api/java-runtimes-refresh": api_java_runtimes_refresh,
+    "/api/mods/installed": api_mods_installed,
+    "/api/mods/version-options": api_mods_version_options,
+    "/api/modpacks/installed": api_modpacks_installed,
+}
 
-    EXACT_WITH_DATA = {
-        "/api/account/login": api_account_login,
-        "/api/account/microsoft/poll": api_account_microsoft_poll,
-        "/api/account/microsoft/skin/save": api_account_microsoft_skin_save,
-        "/api/account/microsoft/skin/delete": api_account_microsoft_skin_delete,
-        "/api/account/microsoft/skin/favorite": api_account_microsoft_skin_favorite,
-        "/api/account/microsoft/skin/upload": api_account_microsoft_skin_upload,
-        "/api/account/microsoft/skin/select": api_account_microsoft_skin_select,
-        "/api/account/microsoft/cape/select": api_account_microsoft_cape_select,
-        "/api/account/microsoft/cape/disable": api_account_microsoft_cape_disable,
-        "/api/account/verify-session": api_account_verify_session,
-        "/api/account/refresh-assets": api_account_refresh_assets,
-        "/api/profiles/create": api_profiles_create,
-        "/api/profiles/switch": api_profiles_switch,
-        "/api/profiles/delete": api_profiles_delete,
-        "/api/profiles/rename": api_profiles_rename,
-        "/api/profiles/versions/create": api_profiles_versions_create,
-        "/api/profiles/versions/switch": api_profiles_versions_switch,
-        "/api/profiles/versions/delete": api_profiles_versions_delete,
-        "/api/profiles/versions/rename": api_profiles_versions_rename,
-        "/api/profiles/mods/create": api_profiles_mods_create,
-        "/api/profiles/mods/switch": api_profiles_mods_switch,
-        "/api/profiles/mods/delete": api_profiles_mods_delete,
-        "/api/profiles/mods/rename": api_profiles_mods_rename,
-        "/api/search": api_search,
-        "/api/launch": api_launch,
-        "/api/crash-log": api_crash_log,
-        "/api/crash-autofix": api_crash_autofix,
-        "/api/open-crash-log": api_open_crash_log,
-        "/api/settings": api_settings,
-        "/api/version/edit": api_version_edit,
-        "/api/storage-directory/select": api_storage_directory_select,
-        "/api/storage-directory/validate": api_storage_directory_validate,
-        "/api/worlds/storage-options": api_worlds_storage_options,
-        "/api/worlds/version-options": api_worlds_version_options,
-        "/api/worlds/installed": api_worlds_installed,
-        "/api/worlds/detail": api_worlds_detail,
-        "/api/worlds/nbt": api_worlds_nbt,
-        "/api/worlds/nbt/simple-update": api_worlds_nbt_simple_update,
-        "/api/worlds/nbt/advanced-update": api_worlds_nbt_advanced_update,
-        "/api/worlds/update": api_worlds_update,
-        "/api/worlds/icon-update": api_worlds_icon_update,
-        "/api/worlds/delete": api_worlds_delete,
-        "/api/worlds/open": api_worlds_open,
-        "/api/worlds/search": api_worlds_search,
-        "/api/worlds/versions": api_worlds_versions,
-        "/api/worlds/install": api_worlds_install,
-        "/api/worlds/export": api_worlds_export,
-        "/api/worlds/import-select": api_worlds_import_select,
-        "/api/worlds/import-scan": api_worlds_import_scan,
-        "/api/worlds/import": api_worlds_import,
-        "/api/screenshots/storage-options": api_screenshots_storage_options,
-        "/api/screenshots/installed": api_screenshots_installed,
-        "/api/screenshots/update": api_screenshots_update,
-        "/api/screenshots/delete": api_screenshots_delete,
-        "/api/screenshots/open": api_screenshots_open,
-        "/api/install": api_install,
-        "/api/delete": api_delete_version,
-        "/api/install-loader": api_install_loader,
-        "/api/delete-loader": api_delete_loader,
-        "/api/delete-corrupted-versions": api_delete_corrupted_versions,
-        "/api/java-download": api_java_download,
-        "/api/versions/export": api_export_versions,
-        "/api/versions/import-select": api_import_versions_select,
-        "/api/versions/import": api_import_versions,
-        "/api/addons/installed": api_mods_installed,
-        "/api/addons/version-options": api_mods_version_options,
-        "/api/mods/search": api_mods_search,
-        "/api/mods/versions": api_mods_versions,
-        "/api/mods/dependencies": api_mods_dependencies,
-        "/api/mods/install": api_mods_install,
-        "/api/mods/import-select": api_mods_import_select,
-        "/api/mods/import": api_mods_import,
-        "/api/mods/delete": api_mods_delete,
-        "/api/mods/toggle": api_mods_toggle,
-        "/api/mods/move": api_mods_move,
-        "/api/mods/set-active-version": api_mods_set_active_version,
-        "/api/mods/archive-subfolders": api_mods_archive_subfolders,
-        "/api/mods/update-version-settings": api_mods_update_version_settings,
-        "/api/mods/detail": api_mods_detail,
-        "/api/modpacks/export": api_modpacks_export,
-        "/api/modpacks/export-versions": api_modpacks_export_versions,
-        "/api/modpacks/import-select": api_modpacks_import_select,
-        "/api/modpacks/import": api_modpacks_import,
-        "/api/modpacks/toggle": api_modpacks_toggle,
-        "/api/modpacks/toggle-mod": api_modpacks_toggle_mod,
-        "/api/modpacks/set-mod-overwrite": api_modpacks_set_mod_overwrite,
-        "/api/modpacks/delete": api_modpacks_delete,
-        "/api/datapacks/deployments": api_datapacks_deployments,
-        "/api/datapacks/apply": api_datapacks_apply,
-        "/api/datapacks/remove": api_datapacks_remove,
-        "/api/diagnostics/report": api_diagnostics_report,
-        "/api/operations/cancel": api_operations_cancel,
-        "/api/playtime/stats": api_playtime_stats,
-        "/api/playtime/sessions": api_playtime_sessions,
-    }
+_EXACT_WITH_DATA = {
+    "/api/account/login": api_account_login,
+    "/api/account/microsoft/poll": api_account_microsoft_poll,
+    "/api/account/microsoft/skin/save": api_account_microsoft_skin_save,
+    "/api/account/microsoft/skin/delete": api_account_microsoft_skin_delete,
+    "/api/account/microsoft/skin/favorite": api_account_microsoft_skin_favorite,
+    "/api/account/microsoft/skin/upload": api_account_microsoft_skin_upload,
+    "/api/account/microsoft/skin/select": api_account_microsoft_skin_select,
+    "/api/account/microsoft/cape/select": api_account_microsoft_cape_select,
+    "/api/account/microsoft/cape/disable": api_account_microsoft_cape_disable,
+    "/api/account/verify-session": api_account_verify_session,
+    "/api/account/refresh-assets": api_account_refresh_assets,
+    "/api/profiles/create": api_profiles_create,
+    "/api/profiles/switch": api_profiles_switch,
+    "/api/profiles/delete": api_profiles_delete,
+    "/api/profiles/rename": api_profiles_rename,
+    "/api/profiles/versions/create": api_profiles_versions_create,
+    "/api/profiles/versions/switch": api_profiles_versions_switch,
+    "/api/profiles/versions/delete": api_profiles_versions_delete,
+    "/api/profiles/versions/rename": api_profiles_versions_rename,
+    "/api/profiles/mods/create": api_profiles_mods_create,
+    "/api/profiles/mods/switch": api_profiles_mods_switch,
+    "/api/profiles/mods/delete": api_profiles_mods_delete,
+    "/api/profiles/mods/rename": api_profiles_mods_rename,
+    "/api/search": api_search,
+    "/api/launch": api_launch,
+    "/api/crash-log": api_crash_log,
+    "/api/crash-autofix": api_crash_autofix,
+    "/api/open-crash-log": api_open_crash_log,
+    "/api/settings": api_settings,
+    "/api/version/edit": api_version_edit,
+    "/api/storage-directory/select": api_storage_directory_select,
+    "/api/storage-directory/validate": api_storage_directory_validate,
+    "/api/worlds/storage-options": api_worlds_storage_options,
+    "/api/worlds/version-options": api_worlds_version_options,
+    "/api/worlds/installed": api_worlds_installed,
+    "/api/worlds/detail": api_worlds_detail,
+    "/api/worlds/nbt": api_worlds_nbt,
+    "/api/worlds/nbt/simple-update": api_worlds_nbt_simple_update,
+    "/api/worlds/nbt/advanced-update": api_worlds_nbt_advanced_update,
+    "/api/worlds/update": api_worlds_update,
+    "/api/worlds/icon-update": api_worlds_icon_update,
+    "/api/worlds/delete": api_worlds_delete,
+    "/api/worlds/open": api_worlds_open,
+    "/api/worlds/search": api_worlds_search,
+    "/api/worlds/versions": api_worlds_versions,
+    "/api/worlds/install": api_worlds_install,
+    "/api/worlds/export": api_worlds_export,
+    "/api/worlds/import-select": api_worlds_import_select,
+    "/api/worlds/import-scan": api_worlds_import_scan,
+    "/api/worlds/import": api_worlds_import,
+    "/api/screenshots/storage-options": api_screenshots_storage_options,
+    "/api/screenshots/installed": api_screenshots_installed,
+    "/api/screenshots/update": api_screenshots_update,
+    "/api/screenshots/delete": api_screenshots_delete,
+    "/api/screenshots/open": api_screenshots_open,
+    "/api/install": api_install,
+    "/api/delete": api_delete_version,
+    "/api/install-loader": api_install_loader,
+    "/api/delete-loader": api_delete_loader,
+    "/api/delete-corrupted-versions": api_delete_corrupted_versions,
+    "/api/java-download": api_java_download,
+    "/api/versions/export": api_export_versions,
+    "/api/versions/import-select": api_import_versions_select,
+    "/api/versions/import": api_import_versions,
+    "/api/addons/installed": api_mods_installed,
+    "/api/addons/version-options": api_mods_version_options,
+    "/api/mods/search": api_mods_search,
+    "/api/mods/versions": api_mods_versions,
+    "/api/mods/dependencies": api_mods_dependencies,
+    "/api/mods/install": api_mods_install,
+    "/api/mods/import-select": api_mods_import_select,
+    "/api/mods/import": api_mods_import,
+    "/api/mods/delete": api_mods_delete,
+    "/api/mods/toggle": api_mods_toggle,
+    "/api/mods/move": api_mods_move,
+    "/api/mods/set-active-version": api_mods_set_active_version,
+    "/api/mods/archive-subfolders": api_mods_archive_subfolders,
+    "/api/mods/update-version-settings": api_mods_update_version_settings,
+    "/api/mods/detail": api_mods_detail,
+    "/api/modpacks/export": api_modpacks_export,
+    "/api/modpacks/export-versions": api_modpacks_export_versions,
+    "/api/modpacks/import-select": api_modpacks_import_select,
+    "/api/modpacks/import": api_modpacks_import,
+    "/api/modpacks/toggle": api_modpacks_toggle,
+    "/api/modpacks/toggle-mod": api_modpacks_toggle_mod,
+    "/api/modpacks/set-mod-overwrite": api_modpacks_set_mod_overwrite,
+    "/api/modpacks/delete": api_modpacks_delete,
+    "/api/datapacks/deployments": api_datapacks_deployments,
+    "/api/datapacks/apply": api_datapacks_apply,
+    "/api/datapacks/remove": api_datapacks_remove,
+    "/api/diagnostics/report": api_diagnostics_report,
+    "/api/operations/cancel": api_operations_cancel,
+    "/api/status_bulk": api_status_bulk,
+    "/api/playtime/stats": api_playtime_stats,
+    "/api/playtime/sessions": api_playtime_sessions,
+}
 
-    PREFIX_HANDLERS = [
-        (
-            "/api/versions",
-            lambda _p: api_versions(
-                _extract_category(_p),
-                force_refresh=_query_flag(path, "refresh") or _query_flag(path, "force"),
-            ),
-        ),
-        ("/api/launch_status/", lambda _p: api_launch_status(_p[len("/api/launch_status/"):])),
-        (
-            "/api/modpacks/import/progress",
-            lambda _p: api_modpacks_import_progress(_query_value(path, "id")),
-        ),
-        (
-            "/api/game_window_visible/",
-            lambda _p: api_game_window_visible(_p[len("/api/game_window_visible/"):]),
-        ),
-        ("/api/status/", lambda _p: api_status(_p[len("/api/status/"):])),
-        ("/api/cancel/", lambda _p: api_cancel(_p[len("/api/cancel/"):])),
-        ("/api/pause/", lambda _p: api_pause(_p[len("/api/pause/"):])),
-        ("/api/resume/", lambda _p: api_resume(_p[len("/api/resume/"):])),
-        (
-            "/api/loaders-installed/",
-            lambda _p: api_loaders_installed(_p[len("/api/loaders-installed/"):]),
+# Checked in order after the exact tables miss.
+_PREFIX_HANDLERS = (
+    (
+        "/api/versions",
+        lambda p, path: api_versions(
+            _extract_category(p),
+            force_refresh=_query_flag(path, "refresh") or _query_flag(path, "force"),
         ),
-        ("/api/loaders/", lambda _p: api_loaders(_p[len("/api/loaders/"):])),
-    ]
+    ),
+    ("/api/launch_status/", lambda p, path: api_launch_status(p[len("/api/launch_status/"):])),
+    (
+        "/api/modpacks/import/progress",
+        lambda p, path: api_modpacks_import_progress(_query_value(path, "id")),
+    ),
+    (
+        "/api/game_window_visible/",
+        lambda p, path: api_game_window_visible(p[len("/api/game_window_visible/"):]),
+    ),
+    ("/api/status/", lambda p, path: api_status(p[len("/api/status/"):])),
+    ("/api/cancel/", lambda p, path: api_cancel(p[len("/api/cancel/"):])),
+    ("/api/pause/", lambda p, path: api_pause(p[len("/api/pause/"):])),
+    ("/api/resume/", lambda p, path: api_resume(p[len("/api/resume/"):])),
+    (
+        "/api/loaders-installed/",
+        lambda p, path: api_loaders_installed(p[len("/api/loaders-installed/"):]),
+    ),
+    ("/api/loaders/", lambda p, path: api_loaders(p[len("/api/loaders/"):])),
+)
+
+
+def handle_api_request(path: str, data: Any):
+    p = path.partition("?")[0].rstrip("/")
 
-    if p in EXACT_NO_PARAMS:
-        return EXACT_NO_PARAMS[p]()
+    handler = _EXACT_NO_PARAMS.get(p)
+    if handler is not None:
+        return handler()
 
-    if p in EXACT_WITH_DATA:
-        return EXACT_WITH_DATA[p](data)
+    handler = _EXACT_WITH_DATA.get(p)
+    if handler is not None:
+        return handler(data)
 
-    for prefix, handler in PREFIX_HANDLERS:
+    for prefix, prefix_handler in _PREFIX_HANDLERS:
         if p.startswith(prefix):
-            return handler(p)
+            return prefix_handler(p, path)
 
     return {"error": "Unknown endpoint"}
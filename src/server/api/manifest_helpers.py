@@ -8,35 +8,42 @@ from core.downloader import progress as _progress
 __all__ = [
     "_map_mojang_type_to_category",
     "_map_manifest_entry_to_category",
-    "_format_mojang_version_entry",
     "_get_installing_map_from_progress",
 ]
 
 
+_MOJANG_TYPE_CATEGORIES = {
+    "release": "Release",
+    "snapshot": "Snapshot",
+    "beta": "Beta",
+    "alpha": "Alpha",
+    "old_beta": "Beta",
+    "old_alpha": "Alpha",
+}
+
+
 def _map_mojang_type_to_category(mojang_type: str) -> str:
-    t = (mojang_type or "").lower()
+    # Manifest types are already lowercase, so try them as-is first.
+    category = _MOJANG_TYPE_CATEGORIES.get(mojang_type)
+    if category is not None:
+        return category
+    t = (mojang_type or "").strip().lower()
+    category = _MOJANG_TYPE_CATEGORIES.get(t)
+    if category is not None:
+        return category
     if t.startswith("old_"):
         t = t[len("old_"):]
-    if t == "release":
-        return "Release"
-    if t == "snapshot":
-        return "Snapshot"
-    if t == "beta":
-        return "Beta"
-    if t == "alpha":
-        return "Alpha"
     return t.capitalize()
 
 
 def _map_manifest_entry_to_category(version_id: str, version_type: str, source: str) -> str:
-    src = (source or "").strip().lower()
-    vid = (version_id or "").strip()
-    vtype = (version_type or "").strip().lower()
-
+    # Sources are set by core.manifest as plain lowercase names.
+    src = source if source in ("mojang", "omniarchive") else (source or "").strip().lower()
     if src != "omniarchive":
-        return _map_mojang_type_to_category(vtype)
+        return _map_mojang_type_to_category(version_type)
 
-    vid_lower = vid.lower()
+    vtype = (version_type or "").strip().lower()
+    vid_lower = (version_id or "").strip().lower()
 
     if vid_lower.startswith("inf-"):
         return "OA-infdev"
@@ -54,24 +61,6 @@ def _map_manifest_entry_to_category(version_id: str, version_type: str, source:
     return "OA-other"
 
 
-def _format_mojang_version_entry(manifest_entry: Dict[str, Any], source: str) -> Dict[str, Any]:
-    vid = manifest_entry.get("id")
-    vtype = manifest_entry.get("type", "")
-    resolved_source = manifest_entry.get("source") or source or "mojang"
-    category = _map_manifest_entry_to_category(vid, vtype, resolved_source)
-    display = vid
-
-    return {
-        "display": display,
-        "category": category,
-        "folder": vid,
-        "launch_disabled": False,
-        "launch_disabled_message": "",
-        "is_remote": True,
-        "source": resolved_source,
-    }
-
-
 def _get_installing_map_from_progress() -> Dict[str, Dict[str, Any]]:
     installing: Dict[str, Dict[str, Any]] = {}
     try:
@@ -1,64 +1,105 @@
 from __future__ import annotations
 
-from core.settings import (
-    get_active_profile_id,
-    get_active_scope_profile_id,
-    list_profiles,
-    list_scope_profiles,
-    load_global_settings,
-)
+import atexit
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+
+from core.settings import get_scope_profiles_state, load_global_settings
 from core.downloader.wiki import _wiki_image_url
-from core.modloaders import LOADER_DISPLAY_NAMES
 from core.version_manager import scan_categories
 
-from server.api._helpers import _prepare_settings_response
+from server.api._helpers import (
+    _is_enabled_setting,
+    _loader_display_name,
+    _parse_install_key,
+    _prepare_settings_response,
+)
 from server.api.manifest_helpers import _get_installing_map_from_progress
+from server.api.routes.versions import _load_remote_versions
+from server.api.version_check import prefetch_launcher_outdated
 
 
 __all__ = ["api_initial"]
 
 
+_INITIAL_EXECUTOR = ThreadPoolExecutor(max_workers=6, thread_name_prefix="api-initial")
+atexit.register(_INITIAL_EXECUTOR.shutdown, wait=False, cancel_futures=True)
+
+# The remote manifest prefetch gets its own worker: on a hanging network it
+# would otherwise tie up the pool the local reads above depend on.
+_REMOTE_PREFETCH_EXECUTOR = ThreadPoolExecutor(max_workers=1, thread_name_prefix="api-initial-remote")
+atexit.register(_REMOTE_PREFETCH_EXECUTOR.shutdown, wait=False, cancel_futures=True)
+_remote_prefetch_future: Future | None = None
+_remote_prefetch_lock = threading.Lock()
+
+
+def _prefetch_remote_versions(show_third_party: bool) -> None:
+    global _remote_prefetch_future
+    with _remote_prefetch_lock:
+        if _remote_prefetch_future is not None and not _remote_prefetch_future.done():
+            return
+        _remote_prefetch_future = _REMOTE_PREFETCH_EXECUTOR.submit(
+            _load_remote_versions, show_third_party
+        )
+
+
 def api_initial():
-    settings_dict = _prepare_settings_response(load_global_settings())
+    # The version scan and the progress files are independent disk reads, so
+    # run them alongside the profile/settings reads below. The outdated check
+    # only warms its cache for the UI's is-launcher-outdated call that follows
+    # the first paint; nothing here waits on it.
+    categories_future = _INITIAL_EXECUTOR.submit(scan_categories)
+    installing_future = _INITIAL_EXECUTOR.submit(_get_installing_map_from_progress)
+    prefetch_launcher_outdated()
+
+    # Each profile accessor re-runs profile initialisation and re-reads its
+    # profiles.json, so read every scope once and reuse the active ids. The
+    # scopes live in separate files; only the settings one is needed here
+    # before anything else can proceed.
+    versions_profiles_future = _INITIAL_EXECUTOR.submit(get_scope_profiles_state, "versions")
+    mods_profiles_future = _INITIAL_EXECUTOR.submit(get_scope_profiles_state, "mods")
+    profiles, active_profile = get_scope_profiles_state("settings")
+
+    settings = load_global_settings(active_profile)
+    # The UI asks /api/versions for the remote list right after this call;
+    # start the manifest fetch now so both network round trips overlap.
+    _prefetch_remote_versions(
+        _is_enabled_setting(settings.get("show_third_party_versions", "0"))
+    )
+    settings_dict = _prepare_settings_response(settings)
 
     try:
-        categories_map = scan_categories()
+        categories_map = categories_future.result()
         local_versions = categories_map.get("* All", [])
         categories = sorted([cat for cat in categories_map.keys() if cat != "* All"])
     except Exception:
         local_versions = []
         categories = []
 
-    installing_map = _get_installing_map_from_progress()
+    versions_profiles, active_versions_profile = versions_profiles_future.result()
+    mods_profiles, active_mods_profile = mods_profiles_future.result()
+    installing_map = installing_future.result()
     installing_list = []
 
     for vkey, prog in installing_map.items():
-        source = "installing"
-        card_full_id = vkey
-        loader_type = ""
-        loader_version = ""
-        if "/" in vkey:
-            parts = vkey.split("/")
-            cat = parts[0]
-            folder = parts[1] if len(parts) > 1 else vkey
-            if len(parts) >= 3 and parts[2].startswith("modloader-"):
-                source = "modloader"
-                tail = parts[2][len("modloader-"):]
-                if "-" in tail:
-                    loader_type, loader_version = tail.split("-", 1)
-                else:
-                    loader_type = tail
-                display_name = LOADER_DISPLAY_NAMES.get(loader_type, loader_type.capitalize())
-                display = f"{display_name} {loader_version}".strip()
-            else:
-                display = folder
-        else:
+        info = _parse_install_key(vkey)
+        if info["category"] is None:
             cat, folder = "Unknown", vkey
+        else:
+            cat, folder = info["category"], info["folder"]
+        loader_type = info["loader_type"] or ""
+        loader_version = info["loader_version"] or ""
+        if info["is_modloader"]:
+            source = "modloader"
+            display = f"{_loader_display_name(loader_type)} {loader_version}".strip()
+        else:
+            source = "installing"
             display = folder
 
-        image_url = _wiki_image_url(folder, "")
         if source == "modloader" and loader_type:
             image_url = f"assets/images/modloader-{loader_type}-versioncard.png"
+        else:
+            image_url = _wiki_image_url(folder, "")
 
         installing_list.append({
             "version_key": vkey,
@@ -67,7 +108,7 @@ def api_initial():
             "display": display,
             "image_url": image_url,
             "source": source,
-            "card_full_id": card_full_id,
+            "card_full_id": vkey,
             "loader_type": loader_type,
             "loader_version": loader_version,
             "overall_percent": prog.get("overall_percent", 0),
@@ -75,13 +116,6 @@ def api_initial():
             "bytes_total": prog.get("bytes_total", 0),
         })
 
-    profiles = list_profiles()
-    active_profile = get_active_profile_id()
-    versions_profiles = list_scope_profiles("versions")
-    active_versions_profile = get_active_scope_profile_id("versions")
-    mods_profiles = list_scope_profiles("mods")
-    active_mods_profile = get_active_scope_profile_id("mods")
-
     return {
         "versions": [],
         "installed": local_versions,
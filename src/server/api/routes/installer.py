@@ -1,7 +1,6 @@
 from __future__ import annotations
 
 import os
-import shutil
 import sys
 import time
 import urllib.parse
@@ -12,8 +11,10 @@ from core.discord_rpc import set_install_presence, set_launcher_presence
 from core.settings import get_base_dir, load_global_settings
 from core.version_manager import get_clients_dir, scan_categories
 
+from server.api._constants import MAX_STATUS_BULK_KEYS
 from server.api._helpers import (
     _is_enabled_setting,
+    _remove_tree,
     _resolve_version_dir_secure,
     _normalize_operation_id,
     _cancel_operation_request,
@@ -30,6 +31,7 @@ from server.api.routes.versions import invalidate_available_versions_cache
 __all__ = [
     "api_install",
     "api_status",
+    "api_status_bulk",
     "api_cancel",
     "api_pause",
     "api_resume",
@@ -81,8 +83,26 @@ def api_install(data):
 
 
 def api_status(version_key):
+    return _install_status(urllib.parse.unquote(version_key))
+
+
+def api_status_bulk(data):
+    # One round trip for every card the UI is polling, instead of one
+    # /api/status/<key> request each.
+    keys = data.get("keys") if isinstance(data, dict) else None
+    if not isinstance(keys, list):
+        return {"error": "invalid request"}
+    if len(keys) > MAX_STATUS_BULK_KEYS:
+        return {"error": f"too many keys (max {MAX_STATUS_BULK_KEYS})"}
+    return {
+        "statuses": {
+            key: _install_status(key) for key in keys if isinstance(key, str) and key
+        }
+    }
+
+
+def _install_status(decoded):
     try:
-        decoded = urllib.parse.unquote(version_key)
         try:
             from core.downloader.progress import read_progress_dict
 
@@ -232,11 +252,11 @@ def api_open_data_folder():
             if sys.platform == "darwin":
                 import subprocess
 
-                subprocess.Popen(["open", base])
+                subprocess.Popen(["open", base], start_new_session=True)
             else:
                 import subprocess
 
-                subprocess.Popen(["xdg-open", base])
+                subprocess.Popen(["xdg-open", base], start_new_session=True)
 
         return {"ok": True}
     except Exception as e:
@@ -266,7 +286,7 @@ def api_delete_version(data):
     version_dir = resolved.get("path") or ""
 
     try:
-        shutil.rmtree(version_dir)
+        _remove_tree(version_dir)
         version_key = f"{category.lower()}/{folder}"
         _progress.delete_progress(version_key)
         _progress.delete_progress(f"{category}/{folder}")
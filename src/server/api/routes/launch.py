@@ -12,7 +12,7 @@ from core.java import (
     suggest_java_feature_version,
 )
 from core.launch.paths import _resolve_version_dir
-from core.logger import safe_print
+from core.logger import close_safe_print_log, safe_print
 from core.settings import get_base_dir
 from core.version_manager import get_clients_dir
 
@@ -42,6 +42,13 @@ __all__ = [
 ]
 
 
+_SERVER_ADDRESS_RE = re.compile(
+    r'^(?:[a-zA-Z0-9](?:[a-zA-Z0-9\-]{0,61}[a-zA-Z0-9])?\.)*'
+    r'[a-zA-Z0-9](?:[a-zA-Z0-9\-]{0,61}[a-zA-Z0-9])?'
+    r'$|^(?:\d{1,3}\.){3}\d{1,3}$'
+)
+_MPPASS_RE = re.compile(r"^[A-Za-z0-9._~\-]+$")
+
 _LEGACY_NORMAL_EXIT_MIN_SECONDS = 20.0
 _LEGACY_CRASH_LOG_MARKERS = (
     "exception in thread",
@@ -125,14 +132,9 @@ def api_launch(data):
     server_port = 25565
     server_mppass = None
     if server_address_raw:
-        _SERVER_RE = re.compile(
-            r'^(?:[a-zA-Z0-9](?:[a-zA-Z0-9\-]{0,61}[a-zA-Z0-9])?\.)*'
-            r'[a-zA-Z0-9](?:[a-zA-Z0-9\-]{0,61}[a-zA-Z0-9])?'
-            r'$|^(?:\d{1,3}\.){3}\d{1,3}$'
-        )
         if len(server_address_raw) > 253:
             return {"ok": False, "message": "Server address is too long"}
-        if not _SERVER_RE.match(server_address_raw):
+        if not _SERVER_ADDRESS_RE.match(server_address_raw):
             return {"ok": False, "message": "Invalid server address format"}
         server_address = server_address_raw
         try:
@@ -143,17 +145,18 @@ def api_launch(data):
         except (TypeError, ValueError):
             return {"ok": False, "message": "Invalid server port"}
         if server_mppass_raw:
-            if len(server_mppass_raw) > 256 or not re.match(r"^[A-Za-z0-9._~\-]+$", server_mppass_raw):
+            if len(server_mppass_raw) > 256 or not _MPPASS_RE.match(server_mppass_raw):
                 return {"ok": False, "message": "Invalid Classic mppass format"}
             server_mppass = server_mppass_raw
 
-    clients_dir = get_clients_dir()
     version_identifier = f"{category}/{folder}"
     version_dir = _resolve_version_dir(version_identifier) or os.path.join(
-        clients_dir, category, folder
+        get_clients_dir(), category, folder
     )
     jar_path = os.path.join(version_dir, "client.jar")
 
+    # The scan only tracks data.ini, so the jar itself still has to be
+    # checked; a version missing it is a broken install, not a launchable one.
     if not os.path.exists(jar_path):
         return {
             "ok": False,
@@ -1066,9 +1069,9 @@ def api_open_crash_log(data: Any):
         if system == "Windows":
             os.startfile(log_path)
         elif system == "Darwin":
-            subprocess.run(["open", log_path])
+            subprocess.Popen(["open", log_path], start_new_session=True)
         else:
-            subprocess.run(["xdg-open", log_path])
+            subprocess.Popen(["xdg-open", log_path], start_new_session=True)
 
         return {"ok": True, "message": f"Opening {os.path.basename(log_path)}..."}
     except Exception as e:
@@ -1087,6 +1090,9 @@ def api_clear_logs():
         skipped_files = []
         deleted_count = 0
 
+        # Windows refuses to delete the launcher log while it is held open.
+        close_safe_print_log()
+
         for root, dirs, files in os.walk(logs_dir, topdown=False):
             for file in files:
                 file_path = os.path.join(root, file)
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import threading
 import time
-from typing import Any
+from typing import Any, TypedDict
 
 from core import manifest as core_manifest
 from core.downloader.wiki import _wiki_image_url
@@ -13,8 +13,8 @@ from server.api._helpers import (
     _is_enabled_setting,
     _version_identity_key,
 )
+from server.api._search_index import SEARCH_FIELD_SEPARATOR, get_search_index
 from server.api.manifest_helpers import (
-    _format_mojang_version_entry,
     _get_installing_map_from_progress,
     _map_manifest_entry_to_category,
 )
@@ -23,6 +23,19 @@ from server.api.manifest_helpers import (
 __all__ = ["api_versions", "api_search", "invalidate_available_versions_cache"]
 
 
+class RemoteVersion(TypedDict):
+    display: str
+    category: str
+    folder: str
+    installed: bool
+    is_remote: bool
+    source: str
+    image_url: str | None
+    recommended: bool
+    installed_local: bool
+    redownload_available: bool
+
+
 _AVAILABLE_VERSIONS_CACHE_TTL_SECONDS = 30 * 60
 _available_versions_cache_lock = threading.Lock()
 _available_versions_cache: dict[bool, dict[str, Any]] = {}
@@ -33,53 +46,7 @@ def invalidate_available_versions_cache():
         _available_versions_cache.clear()
 
 
-def _copy_remote_versions(remote_versions):
-    return [dict(v) for v in (remote_versions or []) if isinstance(v, dict)]
-
-
-def _load_remote_versions(show_third_party: bool, *, force_refresh: bool = False):
-    now = time.time()
-    stale_cached: dict[str, Any] | None = None
-
-    with _available_versions_cache_lock:
-        stale_cached = _available_versions_cache.get(show_third_party)
-
-    if not force_refresh and stale_cached:
-        cache_age = now - stale_cached.get("loaded_at", 0.0)
-        if cache_age < _AVAILABLE_VERSIONS_CACHE_TTL_SECONDS:
-            cached_remote = _copy_remote_versions(stale_cached.get("remote_list"))
-            if cached_remote:
-                return (
-                    cached_remote,
-                    set(stale_cached.get("category_names") or []),
-                    False,
-                )
-
-    try:
-        mf = core_manifest.fetch_manifest(include_third_party=show_third_party)
-        manifest = mf.get("data")
-    except Exception:
-        manifest = None
-
-    if not isinstance(manifest, dict):
-        if stale_cached:
-            return (
-                _copy_remote_versions(stale_cached.get("remote_list")),
-                set(stale_cached.get("category_names") or []),
-                True,
-            )
-        return [], set(), True
-
-    manifest_versions = manifest.get("versions")
-    if not isinstance(manifest_versions, list):
-        if stale_cached:
-            return (
-                _copy_remote_versions(stale_cached.get("remote_list")),
-                set(stale_cached.get("category_names") or []),
-                True,
-            )
-        return [], set(), True
-
+def _build_remote_versions(manifest, manifest_versions, low_data):
     latest_info = manifest.get("latest") if isinstance(manifest.get("latest"), dict) else {}
     recommended_id = str((latest_info or {}).get("release") or "").strip()
     if not recommended_id:
@@ -88,7 +55,14 @@ def _load_remote_versions(show_third_party: bool, *, force_refresh: bool = False
                 recommended_id = str(m.get("id"))
                 break
 
-    remote_list = []
+    # Kept column-wise: most entries are filtered out or never requested, so
+    # dicts are only built for the ones a response actually returns.
+    folders = []
+    categories = []
+    sources = []
+    image_urls = []
+    identity_keys = []
+    by_category: dict[str, list[int]] = {}
     category_names = set()
     for m in manifest_versions:
         vid = m.get("id")
@@ -96,92 +70,160 @@ def _load_remote_versions(show_third_party: bool, *, force_refresh: bool = False
         source = m.get("source") or "mojang"
         mapped_cat = _map_manifest_entry_to_category(vid, vtype, source)
         category_names.add(mapped_cat)
-        remote_list.append({
-            "display": vid,
-            "category": mapped_cat,
-            "folder": vid,
-            "installed": False,
-            "is_remote": True,
-            "source": source,
-            "image_url": _wiki_image_url(vid, vtype),
-            "recommended": bool(recommended_id and vid == recommended_id),
-        })
+        by_category.setdefault(str(mapped_cat or "").casefold(), []).append(len(folders))
+        folders.append(vid)
+        categories.append(mapped_cat)
+        sources.append(source)
+        image_urls.append(_wiki_image_url(vid, vtype, low_data=low_data))
+        identity_keys.append(_version_identity_key(mapped_cat, vid))
+
+    return {
+        "manifest_versions": manifest_versions,
+        "low_data": low_data,
+        "recommended_id": recommended_id,
+        "folders": folders,
+        "categories": categories,
+        "sources": sources,
+        "image_urls": image_urls,
+        "identity_keys": identity_keys,
+        # category.casefold() -> row indices
+        "by_category": by_category,
+        "category_names": sorted(category_names),
+    }
 
-    if not remote_list:
-        if stale_cached:
-            return (
-                _copy_remote_versions(stale_cached.get("remote_list")),
-                set(stale_cached.get("category_names") or []),
-                True,
-            )
-        return [], set(), True
+
+def _load_remote_versions(show_third_party: bool, *, force_refresh: bool = False):
+    """Return ``(cached_entry, manifest_error)`` for the available-versions list.
+
+    The entry's lists are shared between requests and must not be mutated.
+    ``cached_entry`` is None only when nothing could be loaded at all.
+    """
+    now = time.time()
 
     with _available_versions_cache_lock:
-        _available_versions_cache[show_third_party] = {
-            "loaded_at": now,
-            "remote_list": _copy_remote_versions(remote_list),
-            "category_names": sorted(category_names),
-        }
+        cached = _available_versions_cache.get(show_third_party)
 
-    return remote_list, category_names, False
+    if not force_refresh and cached:
+        if now - cached["loaded_at"] < _AVAILABLE_VERSIONS_CACHE_TTL_SECONDS:
+            return cached, False
+
+    try:
+        mf = core_manifest.fetch_manifest(include_third_party=show_third_party)
+        manifest = mf.get("data")
+    except Exception:
+        manifest = None
+
+    manifest_versions = manifest.get("versions") if isinstance(manifest, dict) else None
+    if not isinstance(manifest_versions, list):
+        return cached, True
+
+    # fetch_manifest hands back the same parsed object until it refetches, so
+    # an unchanged list means the derived entries are still valid.
+    low_data = load_global_settings().get("low_data_mode") == "1"
+    if (
+        cached
+        and cached["manifest_versions"] is manifest_versions
+        and cached["low_data"] == low_data
+    ):
+        built = cached
+    else:
+        built = _build_remote_versions(manifest, manifest_versions, low_data)
+        if not built["folders"]:
+            return cached, True
+
+    entry = dict(built, loaded_at=now)
+    with _available_versions_cache_lock:
+        _available_versions_cache[show_third_party] = entry
+    return entry, False
+
+
+# (scan "* All" list, identity keys); the scan hands back the same list until
+# it rescans, so UI refreshes reuse the set.
+_installed_keys_cache: tuple[Any, frozenset[str]] | None = None
+
+
+def _installed_identity_keys(local_versions) -> frozenset[str]:
+    global _installed_keys_cache
+
+    cached = _installed_keys_cache
+    if cached is not None and cached[0] is local_versions:
+        return cached[1]
+    keys = frozenset(
+        _version_identity_key(lv.get("category"), lv.get("folder"))
+        for lv in local_versions
+    )
+    _installed_keys_cache = (local_versions, keys)
+    return keys
+
+
+def _installing_identity_keys(installing_map) -> set[str]:
+    keys = set()
+    for vkey in installing_map:
+        cat, sep, folder = vkey.partition("/")
+        if not sep:
+            cat, folder = "Unknown", vkey
+        keys.add(_version_identity_key(cat, folder))
+    return keys
 
 
 def api_versions(category, *, force_refresh: bool = False):
     categories = scan_categories()
     local_versions = categories.get("* All", [])
+    # The scan is already grouped by category; every entry carries its
+    # group's name, so non-empty groups are exactly the local categories.
     category_names = {
-        v.get("category")
-        for v in local_versions
-        if isinstance(v, dict) and v.get("category")
+        name for name, entries in categories.items() if name != "* All" and name and entries
     }
 
     settings_dict = load_global_settings()
     show_third_party = _is_enabled_setting(settings_dict.get("show_third_party_versions", "0"))
 
-    remote_list, remote_category_names, manifest_error = _load_remote_versions(
+    remote, manifest_error = _load_remote_versions(
         show_third_party,
         force_refresh=force_refresh,
     )
-    category_names.update(remote_category_names)
-
-    installed_set = {
-        _version_identity_key(lv.get("category"), lv.get("folder"))
-        for lv in local_versions
-    }
+    if remote:
+        category_names.update(remote["category_names"])
 
-    installing_map = _get_installing_map_from_progress()
-    installing_keys = set()
-    for vkey in installing_map.keys():
-        if "/" in vkey:
-            cat, folder = vkey.split("/", 1)
-        else:
-            cat, folder = "Unknown", vkey
-        installing_keys.add(_version_identity_key(cat, folder))
-
-    def prepare_remote(entry):
-        key_str = _version_identity_key(entry.get("category"), entry.get("folder"))
-        if key_str in installing_keys:
-            return None
-        prepared = dict(entry)
-        is_installed = key_str in installed_set
-        prepared["installed"] = False
-        prepared["installed_local"] = is_installed
-        prepared["redownload_available"] = is_installed
-        return prepared
+    installed_set = _installed_identity_keys(local_versions)
+    installing_keys = _installing_identity_keys(_get_installing_map_from_progress())
 
     if not category or category == "* All":
         installed_out = local_versions
-        remote_out = [m for m in (prepare_remote(m) for m in remote_list) if m]
+        remote_indices = range(len(remote["folders"])) if remote else ()
     else:
         category_key = str(category or "").casefold()
         installed_out = [
-            lv for lv in local_versions
-            if str(lv.get("category") or "").casefold() == category_key
-        ]
-        remote_out = [
-            m for m in (prepare_remote(m) for m in remote_list)
-            if m and str(m.get("category") or "").casefold() == category_key
+            lv
+            for name, entries in categories.items()
+            if name != "* All" and name.casefold() == category_key
+            for lv in entries
         ]
+        remote_indices = remote["by_category"].get(category_key, ()) if remote else ()
+
+    remote_out: list[RemoteVersion] = []
+    if remote:
+        folders = remote["folders"]
+        identity_keys = remote["identity_keys"]
+        recommended_id = remote["recommended_id"]
+        for i in remote_indices:
+            key_str = identity_keys[i]
+            if key_str in installing_keys:
+                continue
+            is_installed = key_str in installed_set
+            vid = folders[i]
+            remote_out.append(RemoteVersion(
+                display=vid,
+                category=remote["categories"][i],
+                folder=vid,
+                installed=False,
+                is_remote=True,
+                source=remote["sources"][i],
+                image_url=remote["image_urls"][i],
+                recommended=bool(recommended_id and vid == recommended_id),
+                installed_local=is_installed,
+                redownload_available=is_installed,
+            ))
 
     return {
         "ok": True,
@@ -192,6 +234,24 @@ def api_versions(category, *, force_refresh: bool = False):
     }
 
 
+def _local_search_haystacks(versions):
+    return [
+        SEARCH_FIELD_SEPARATOR.join((
+            v.get("display_name") or "",
+            v.get("folder") or "",
+            v.get("category") or "",
+        )).lower()
+        for v in versions
+    ]
+
+
+def _remote_search_haystacks(folders, categories):
+    return [
+        f"{vid}{SEARCH_FIELD_SEPARATOR}{cat}".lower()
+        for vid, cat in zip(folders, categories)
+    ]
+
+
 def api_search(data):
     if not isinstance(data, dict):
         return {"results": []}
@@ -203,28 +263,28 @@ def api_search(data):
     results = []
 
     if category and category in categories:
-        source_list = categories[category]
+        source_key = category
     else:
-        source_list = categories.get("* All", [])
+        source_key = "* All"
+    source_list = categories.get(source_key, [])
 
     if not q:
         return {"results": []}
 
-    for v in source_list:
-        if (
-            q in (v.get("display_name") or "").lower()
-            or q in (v.get("folder") or "").lower()
-            or q in (v.get("category") or "").lower()
-        ):
-            results.append({
-                "display": f"{v['display_name']}  [{v['category']}/{v['folder']}]",
-                "category": v["category"],
-                "folder": v["folder"],
-                "launch_disabled": v.get("launch_disabled", False),
-                "launch_disabled_message": v.get("launch_disabled_message", ""),
-                "is_remote": False,
-                "source": "local",
-            })
+    local_index = get_search_index(
+        f"local:{source_key}", source_list, _local_search_haystacks
+    )
+    for idx in local_index.search(q):
+        v = source_list[idx]
+        results.append({
+            "display": f"{v['display_name']}  [{v['category']}/{v['folder']}]",
+            "category": v["category"],
+            "folder": v["folder"],
+            "launch_disabled": v.get("launch_disabled", False),
+            "launch_disabled_message": v.get("launch_disabled_message", ""),
+            "is_remote": False,
+            "source": "local",
+        })
 
     try:
         settings_dict = load_global_settings()
@@ -232,16 +292,26 @@ def api_search(data):
             settings_dict.get("show_third_party_versions", "0")
         )
 
-        mf = core_manifest.fetch_manifest(include_third_party=show_third_party)
-        manifest = mf.get("data") or {}
-        manifest_source = mf.get("source") or "mojang"
-        for m in manifest.get("versions", []):
-            vid = m.get("id", "")
-            vtype = m.get("type", "")
-            source = m.get("source") or manifest_source
-            cat = _map_manifest_entry_to_category(vid, vtype, source)
-            if q in vid.lower() or q in cat.lower():
-                results.append(_format_mojang_version_entry(m, source))
+        # Same rows the versions list shows, with categories already mapped.
+        remote, _ = _load_remote_versions(show_third_party)
+        if remote:
+            folders = remote["folders"]
+            categories_col = remote["categories"]
+            remote_index = get_search_index(
+                f"remote:{show_third_party}",
+                folders,
+                lambda rows: _remote_search_haystacks(rows, categories_col),
+            )
+            for idx in remote_index.search(q):
+                results.append({
+                    "display": folders[idx],
+                    "category": categories_col[idx],
+                    "folder": folders[idx],
+                    "launch_disabled": False,
+                    "launch_disabled_message": "",
+                    "is_remote": True,
+                    "source": remote["sources"][idx],
+                })
     except Exception:
         pass
 
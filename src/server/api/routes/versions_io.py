@@ -269,9 +269,9 @@ def api_export_versions(data):
                     if platform.system() == "Windows":
                         os.startfile(os.path.dirname(save_path))
                     elif platform.system() == "Darwin":
-                        subprocess.run(["open", os.path.dirname(save_path)])
+                        subprocess.Popen(["open", os.path.dirname(save_path)], start_new_session=True)
                     else:
-                        subprocess.run(["xdg-open", os.path.dirname(save_path)])
+                        subprocess.Popen(["xdg-open", os.path.dirname(save_path)], start_new_session=True)
                 except Exception:
                     pass
 
@@ -1,11 +1,21 @@
 from __future__ import annotations
 
+import atexit
 import os
-import urllib.request
+import threading
+import time
+import urllib.error
+from concurrent.futures import Future, ThreadPoolExecutor
 
+from core import http_pool
 from core.settings import _apply_url_proxy
 
-from server.api._constants import GITHUB_RAW_VERSION_URL, REMOTE_TIMEOUT
+from server.api._constants import (
+    GITHUB_RAW_VERSION_URL,
+    REMOTE_TIMEOUT,
+    REMOTE_VERSION_CACHE_TTL_S,
+    REMOTE_VERSION_MAX_BYTES,
+)
 
 
 __all__ = [
@@ -13,31 +23,95 @@ __all__ = [
     "fetch_remote_version",
     "parse_version",
     "is_launcher_outdated",
+    "prefetch_launcher_outdated",
 ]
 
 
+_PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+# path -> (mtime_ns, stripped contents); version.dat only changes on update.
+_local_version_cache: dict[str, tuple[int, str]] = {}
+_local_version_cache_lock = threading.Lock()
+
+
 def read_local_version(project_root: str = None, base_dir: str = None) -> str:
     try:
         if project_root is None and base_dir is not None:
             project_root = base_dir
         if project_root is None:
-            project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+            project_root = _PROJECT_ROOT
         path = os.path.join(project_root, "version.dat")
+        mtime_ns = os.stat(path).st_mtime_ns
+        with _local_version_cache_lock:
+            cached = _local_version_cache.get(path)
+        if cached is not None and cached[0] == mtime_ns:
+            return cached[1]
         with open(path, "r", encoding="utf-8") as f:
-            return f.read().strip()
+            value = f.read().strip()
+        with _local_version_cache_lock:
+            _local_version_cache[path] = (mtime_ns, value)
+        return value
     except Exception:
         return None
 
 
+_remote_version_cache_lock = threading.Lock()
+_remote_version_cache = {
+    "url": None,
+    "value": None,
+    "etag": None,
+    "last_modified": None,
+    "expires": 0.0,
+}
+
+
 def fetch_remote_version(timeout=REMOTE_TIMEOUT):
     try:
         url = _apply_url_proxy(GITHUB_RAW_VERSION_URL)
-        req = urllib.request.Request(url, headers={"User-Agent": "Histolauncher/1.0"})
-        with urllib.request.urlopen(req, timeout=timeout) as resp:
-            return resp.read().decode("utf-8").strip()
     except Exception:
         return None
 
+    with _remote_version_cache_lock:
+        cached = dict(_remote_version_cache)
+    if cached["url"] != url or cached["value"] is None:
+        cached = None
+    elif time.monotonic() < cached["expires"]:
+        return cached["value"]
+
+    headers = {"User-Agent": "Histolauncher/1.0"}
+    if cached is not None:
+        if cached["etag"]:
+            headers["If-None-Match"] = cached["etag"]
+        if cached["last_modified"]:
+            headers["If-Modified-Since"] = cached["last_modified"]
+
+    try:
+        resp = http_pool.request(
+            url, headers=headers, timeout=timeout, max_bytes=REMOTE_VERSION_MAX_BYTES
+        )
+        value = resp.body.decode("utf-8", "replace").strip()
+        etag = resp.headers.get("ETag")
+        last_modified = resp.headers.get("Last-Modified")
+    except urllib.error.HTTPError as e:
+        if e.code != 304 or cached is None:
+            return None
+        value = cached["value"]
+        etag = e.headers.get("ETag") or cached["etag"]
+        last_modified = e.headers.get("Last-Modified") or cached["last_modified"]
+    except Exception:
+        return None
+
+    with _remote_version_cache_lock:
+        _remote_version_cache.update(
+            url=url,
+            value=value,
+            etag=etag,
+            last_modified=last_modified,
+            expires=time.monotonic() + REMOTE_VERSION_CACHE_TTL_S,
+        )
+    return value
+
 
 def parse_version(ver):
     if not ver or len(ver) < 2:
@@ -50,9 +124,8 @@ def parse_version(ver):
         return None, None
 
 
-def is_launcher_outdated():
-    project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-    local = read_local_version(project_root=project_root)
+def _check_launcher_outdated() -> bool:
+    local = read_local_version(project_root=_PROJECT_ROOT)
     remote = fetch_remote_version()
 
     if not local or not remote:
@@ -68,3 +141,49 @@ def is_launcher_outdated():
         return False
 
     return r_num > l_num
+
+
+_outdated_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="launcher-version-check")
+atexit.register(_outdated_executor.shutdown, wait=False, cancel_futures=True)
+
+_outdated_lock = threading.Lock()
+_outdated_state = {"value": None, "checked_at": 0.0, "future": None}
+
+
+def _refresh_launcher_outdated() -> bool:
+    value = _check_launcher_outdated()
+    with _outdated_lock:
+        _outdated_state["value"] = value
+        _outdated_state["checked_at"] = time.monotonic()
+    return value
+
+
+def prefetch_launcher_outdated() -> Future:
+    """Start a background outdated check unless one is already running."""
+    with _outdated_lock:
+        future = _outdated_state["future"]
+        if future is None or future.done():
+            future = _outdated_executor.submit(_refresh_launcher_outdated)
+            _outdated_state["future"] = future
+        return future
+
+
+def is_launcher_outdated():
+    # Answer from the last check and refresh it in the background once it
+    # ages out; only the very first call has to wait for the network.
+    with _outdated_lock:
+        value = _outdated_state["value"]
+        checked_at = _outdated_state["checked_at"]
+
+    if value is not None:
+        if time.monotonic() - checked_at >= REMOTE_VERSION_CACHE_TTL_S:
+            prefetch_launcher_outdated()
+        return value
+
+    # The socket timeout applies per operation, so a slow-trickling response
+    # could keep the fetch going well past REMOTE_TIMEOUT; cap the wait here
+    # and let the check finish in the background for the next call.
+    try:
+        return prefetch_launcher_outdated().result(timeout=REMOTE_TIMEOUT)
+    except Exception:
+        return False
@@ -3,10 +3,18 @@ from __future__ import annotations
 import os
 
 
-__all__ = ["BASE_DIR", "UI_DIR"]
+__all__ = ["BASE_DIR", "JSON_GZIP_MIN_BYTES", "KEEP_ALIVE_TIMEOUT_SECONDS", "UI_DIR"]
 
 
 BASE_DIR = os.path.dirname(
     os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 )
 UI_DIR = os.path.join(BASE_DIR, "ui")
+
+# JSON bodies smaller than this are sent uncompressed; gzip would barely
+# shrink them.
+JSON_GZIP_MIN_BYTES = 1024
+
+# How long an idle keep-alive connection may hold its handler thread while
+# waiting for the next request.
+KEEP_ALIVE_TIMEOUT_SECONDS = 30
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import gzip
+import hashlib
 import html
 import ipaddress
 import json
@@ -13,6 +15,7 @@ import urllib.parse
 from http.server import SimpleHTTPRequestHandler
 from urllib.parse import unquote, urlparse, quote
 
+from core import _fastjson
 from core.logger import safe_print, dim_line
 
 from server import yggdrasil
@@ -32,17 +35,74 @@ from server.api._constants import (
 )
 from server.api.version_check import read_local_version
 
-from server.http._constants import BASE_DIR
+from server.http._constants import BASE_DIR, JSON_GZIP_MIN_BYTES, KEEP_ALIVE_TIMEOUT_SECONDS
 from server.http.multipart import parse_multipart_form
 from server.http.proxy import ProxyMixin
 from server.http.static_paths import StaticPathsMixin
 from server.http.textures import TextureMixin
 
-
 __all__ = ["RequestHandler"]
 
 
+_SESSION_PROFILE_RE = re.compile(r"^/session/minecraft/profile/[0-9a-fA-F-]{32,36}/?$")
+
+_LEGACY_SKIN_PREFIXES = (
+    "/authserver/skins/MinecraftSkins/",
+    "/skins/MinecraftSkins/",
+    "/MinecraftSkins/",
+    "/http/skins.minecraft.net/MinecraftSkins/",
+    "/https/skins.minecraft.net/MinecraftSkins/",
+    "/http/s3.amazonaws.com/MinecraftSkins/",
+    "/https/s3.amazonaws.com/MinecraftSkins/",
+)
+_LEGACY_CLOAK_PREFIXES = (
+    "/authserver/skins/MinecraftCloaks/",
+    "/skins/MinecraftCloaks/",
+    "/MinecraftCloaks/",
+    "/http/skins.minecraft.net/MinecraftCloaks/",
+    "/https/skins.minecraft.net/MinecraftCloaks/",
+    "/http/s3.amazonaws.com/MinecraftCloaks/",
+    "/https/s3.amazonaws.com/MinecraftCloaks/",
+)
+
+# ((launcher_version, profile_key_enabled), encoded /authserver body)
+_ygg_metadata_cache: tuple[tuple[str, bool], bytes] | None = None
+
+
+def _accepts_gzip(accept_encoding: str | None) -> bool:
+    for part in str(accept_encoding or "").split(","):
+        coding, _, params = part.partition(";")
+        if coding.strip().lower() != "gzip":
+            continue
+        q = params.strip().lower()
+        return not (q.startswith("q=") and q[2:].strip().rstrip("0").rstrip(".") in ("", "0"))
+    return False
+
+
+def _body_etag(data: bytes) -> str:
+    return '"' + hashlib.blake2b(data, digest_size=8).hexdigest() + '"'
+
+
+def _etag_matches(if_none_match: str | None, etag: str) -> bool:
+    for candidate in str(if_none_match or "").split(","):
+        candidate = candidate.strip()
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == "*" or candidate == etag:
+            return True
+    return False
+
+
+def _matched_prefix(path: str, prefixes: tuple[str, ...]) -> str | None:
+    # One C-level startswith over the tuple settles the common miss.
+    if not path.startswith(prefixes):
+        return None
+    return next(pfx for pfx in prefixes if path.startswith(pfx))
+
+
 def _is_player_certificates_path(path: str) -> bool:
+    if "certificates" not in path:
+        return False
     normalized = "/" + "/".join(
         part for part in str(path or "").split("/") if part
     )
@@ -54,6 +114,8 @@ def _is_player_certificates_path(path: str) -> bool:
 
 
 def _is_player_attributes_path(path: str) -> bool:
+    if "attributes" not in path:
+        return False
     normalized = "/" + "/".join(
         part for part in str(path or "").split("/") if part
     )
@@ -74,17 +136,20 @@ def _normalized_yggdrasil_session_path(path: str) -> str:
 
 
 def _is_yggdrasil_session_profile_path(path: str) -> bool:
-    return bool(re.match(
-        r"^/session/minecraft/profile/[0-9a-fA-F-]{32,36}/?$",
-        _normalized_yggdrasil_session_path(path),
-    ))
+    if "/session" not in path:
+        return False
+    return bool(_SESSION_PROFILE_RE.match(_normalized_yggdrasil_session_path(path)))
 
 
 def _is_yggdrasil_has_joined_path(path: str) -> bool:
+    if "hasJoined" not in path:
+        return False
     return _normalized_yggdrasil_session_path(path) == "/session/minecraft/hasJoined"
 
 
 def _is_yggdrasil_join_path(path: str) -> bool:
+    if "join" not in path:
+        return False
     return _normalized_yggdrasil_session_path(path) == "/session/minecraft/join"
 
 
@@ -181,6 +246,33 @@ class RequestHandler(
     StaticPathsMixin,
     SimpleHTTPRequestHandler,
 ):
+    # Headers and body go out as separate writes; with Nagle on, the body can
+    # sit behind a delayed ACK for the headers (worst on Windows loopback).
+    disable_nagle_algorithm = True
+    # Buffer writes so the SSE frames and any handler that writes in pieces
+    # reach the socket as one send() per flush; the base class flushes after
+    # every request.
+    wbufsize = 64 * 1024
+
+    # Keep-alive lets the UI and the game reuse one connection for their bursts
+    # of small requests instead of connecting per request. Every response path
+    # sends a Content-Length; the event streams close when they end.
+    protocol_version = "HTTP/1.1"
+    timeout = KEEP_ALIVE_TIMEOUT_SECONDS
+
+    def handle_one_request(self):
+        self._response_sent = False
+        super().handle_one_request()
+        # Only GET is reused: HEAD runs do_GET and so writes a body, other
+        # methods may leave an unread request body behind, and a handler that
+        # sent nothing would otherwise leave the client waiting.
+        if getattr(self, "command", None) != "GET" or not self._response_sent:
+            self.close_connection = True
+
+    def send_response_only(self, code, message=None):
+        self._response_sent = True
+        super().send_response_only(code, message)
+
     def handle_error(self):
         try:
             exc_type, exc_value = sys.exc_info()[:2]
@@ -200,6 +292,9 @@ class RequestHandler(
                 or "/texture/" in req_line
             ):
                 return
+        if format.startswith("Request timed out"):
+            # An idle keep-alive connection expiring, not an error.
+            return
         message = self.log_date_time_string() + " - " + format % args
         safe_print(dim_line(message))
 
@@ -333,6 +428,25 @@ class RequestHandler(
         except Exception: pass
         return True
 
+    # Set only while _end_headers_with_body runs; see flush_headers.
+    _body_with_headers: bytes | None = None
+
+    def _end_headers_with_body(self, body: bytes):
+        # A body larger than what is left of wfile's buffer is written on its
+        # own, after the headers; hand it to flush_headers to go in one.
+        self._body_with_headers = body
+        try:
+            self.end_headers()
+        finally:
+            self._body_with_headers = None
+
+    def flush_headers(self):
+        body = self._body_with_headers
+        if body and hasattr(self, "_headers_buffer"):
+            self._headers_buffer.append(body)
+            self._body_with_headers = None
+        super().flush_headers()
+
     def end_headers(self):
         parsed = urlparse(getattr(self, "path", "") or "")
         if parsed.path == "/account-settings-frame":
@@ -341,8 +455,23 @@ class RequestHandler(
             self.send_header("X-Frame-Options", "DENY")
         self.send_header("X-Content-Type-Options", "nosniff")
         self.send_header("X-XSS-Protection", "1; mode=block")
+        if getattr(self, "command", None) != "GET" and not self.close_connection:
+            # See handle_one_request: only GET connections are kept open.
+            self.send_header("Connection", "close")
         super().end_headers()
 
+    def copyfile(self, source, outputfile):
+        # Static files (client jars under /clients/ in particular) go out via
+        # os.sendfile where the platform has it. Without it socket.sendfile
+        # would fall back to 8 KiB send() calls, which is slower than
+        # copyfileobj's larger buffer (1 MiB on Windows), so use that instead.
+        if outputfile is self.wfile and hasattr(os, "sendfile"):
+            # The headers may still sit in wfile's buffer.
+            self.wfile.flush()
+            self.connection.sendfile(source)
+            return
+        super().copyfile(source, outputfile)
+
     def _check_content_length(self, max_size: int = MAX_PAYLOAD_SIZE) -> bool:
         try:
             content_length = int(self.headers.get("Content-Length", 0))
@@ -357,12 +486,55 @@ class RequestHandler(
             return False
 
     def _send_json(self, obj, status: int = 200):
-        encoded = json.dumps(obj).encode("utf-8")
+        # Handlers that cache their response hand over the encoded bytes.
+        encoded = obj if isinstance(obj, bytes) else _fastjson.dumps_bytes(obj)
         self.send_response(status)
         self.send_header("Content-Type", "application/json")
+        if len(encoded) >= JSON_GZIP_MIN_BYTES and _accepts_gzip(self.headers.get("Accept-Encoding")):
+            # Level 1: the version lists are highly repetitive, so the fastest
+            # setting already gets most of the size reduction.
+            encoded = gzip.compress(encoded, compresslevel=1, mtime=0)
+            self.send_header("Content-Encoding", "gzip")
+        self.send_header("Vary", "Accept-Encoding")
         self.send_header("Content-Length", str(len(encoded)))
+        self._end_headers_with_body(encoded)
+
+    def _send_validated_body(self, data: bytes, content_type: str, cache_control: str | None = None):
+        # Clients that poll an unchanged resource get a bodyless 304.
+        etag = _body_etag(data)
+        if _etag_matches(self.headers.get("If-None-Match"), etag):
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            if cache_control:
+                self.send_header("Cache-Control", cache_control)
+            self.end_headers()
+            return
+        self.send_response(200)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(data)))
+        self.send_header("ETag", etag)
+        if cache_control:
+            self.send_header("Cache-Control", cache_control)
+        self._end_headers_with_body(data)
+
+    def _send_validated_file(self, f, content_type: str, cache_control: str | None = None):
+        st = os.fstat(f.fileno())
+        etag = f'"{st.st_mtime_ns:x}-{st.st_size:x}"'
+        if _etag_matches(self.headers.get("If-None-Match"), etag):
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            if cache_control:
+                self.send_header("Cache-Control", cache_control)
+            self.end_headers()
+            return
+        self.send_response(200)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(st.st_size))
+        self.send_header("ETag", etag)
+        if cache_control:
+            self.send_header("Cache-Control", cache_control)
         self.end_headers()
-        self.wfile.write(encoded)
+        self.copyfile(f, self.wfile)
 
     def _validate_api_request_origin(self) -> bool:
         sec_fetch_site = str(self.headers.get("Sec-Fetch-Site", "") or "").strip().lower()
@@ -403,7 +575,11 @@ class RequestHandler(
         self._send_json({"ok": False, "error": "API POST requests must use application/json."}, status=415)
         return False
 
-    def _send_ygg_metadata(self):
+    def _ygg_metadata_body(self) -> bytes:
+        global _ygg_metadata_cache
+
+        # Both inputs come from mtime-checked caches, so the only per-request
+        # work left is comparing them with the key of the encoded body.
         launcher_version = read_local_version(base_dir=BASE_DIR)
 
         try:
@@ -412,6 +588,11 @@ class RequestHandler(
         except Exception:
             profile_key_enabled = False
 
+        key = (launcher_version, profile_key_enabled)
+        cached = _ygg_metadata_cache
+        if cached is not None and cached[0] == key:
+            return cached[1]
+
         data = {
             "meta": {
                 "serverName": f"Histolauncher {launcher_version}",
@@ -434,7 +615,9 @@ class RequestHandler(
             },
         }
 
-        return data
+        encoded = _fastjson.dumps_bytes(data)
+        _ygg_metadata_cache = (key, encoded)
+        return encoded
 
     def _handle_playtime_live_stream(self):
         import time as _time
@@ -454,6 +637,8 @@ class RequestHandler(
         self.send_header("Connection", "keep-alive")
         self.send_header("Access-Control-Allow-Origin", "*")
         self.end_headers()
+        self.wfile.flush()
+        self.close_connection = True
 
         try:
             while True:
@@ -479,7 +664,7 @@ class RequestHandler(
                         payload = {"playing": False}
 
                     self.wfile.write(b"data: ")
-                    self.wfile.write(json.dumps(payload).encode("utf-8"))
+                    self.wfile.write(_fastjson.dumps_bytes(payload))
                     self.wfile.write(b"\n\n")
                     self.wfile.flush()
                     _time.sleep(1.0)
@@ -501,6 +686,8 @@ class RequestHandler(
         self.send_header('Connection', 'keep-alive')
         self.send_header('Access-Control-Allow-Origin', '*')
         self.end_headers()
+        self.wfile.flush()
+        self.close_connection = True
 
         q = queue.Queue(maxsize=100)
         add_progress_listener(q)
@@ -509,7 +696,7 @@ class RequestHandler(
             if initial_status and initial_status.get("status"):
                 initial_status["version_key"] = encoded_target
                 self.wfile.write(b"data: ")
-                self.wfile.write(json.dumps(initial_status).encode("utf-8"))
+                self.wfile.write(_fastjson.dumps_bytes(initial_status))
                 self.wfile.write(b"\n\n")
                 self.wfile.flush()
 
@@ -518,7 +705,7 @@ class RequestHandler(
                     event_data = q.get(timeout=2.0)
                     if event_data.get("version_key") == encoded_target:
                         self.wfile.write(b"data: ")
-                        self.wfile.write(json.dumps(event_data).encode("utf-8"))
+                        self.wfile.write(_fastjson.dumps_bytes(event_data))
                         self.wfile.write(b"\n\n")
                         self.wfile.flush()
                 except queue.Empty:
@@ -676,30 +863,24 @@ class RequestHandler(
         if path == "/launcher/version.dat":
             try:
                 data = read_local_version(base_dir=BASE_DIR).encode("utf-8")
-                self.send_response(200)
-                self.send_header("Content-Type", "text/plain; charset=utf-8")
-                self.send_header("Content-Length", str(len(data)))
-                self.end_headers()
-                self.wfile.write(data)
+                self._send_validated_body(data, "text/plain; charset=utf-8")
             except Exception:
                 self.send_error(404, "version.dat not found")
             return
 
         # Yggdrasil metadata
         if path == "/authserver" or path == "/authserver/":
-            data = self._send_ygg_metadata()
-            encoded = json.dumps(data).encode("utf-8")
+            encoded = self._ygg_metadata_body()
             self.send_response(200)
             self.send_header("Content-Type", "application/json")
             self.send_header("Content-Length", str(len(encoded)))
-            self.end_headers()
-            self.wfile.write(encoded)
+            self._end_headers_with_body(encoded)
             return
 
         # Yggdrasil authenticate
         if path == "/authserver/authenticate":
             length = int(self.headers.get("Content-Length", 0))
-            body = self.rfile.read(length).decode("utf-8")
+            body = self.rfile.read(length)
             status, resp = yggdrasil.handle_auth_post(
                 path, body, self.server.server_port
             )
@@ -727,28 +908,7 @@ class RequestHandler(
             self._send_json(resp, status=status)
             return
 
-        legacy_skin_prefixes = [
-            "/authserver/skins/MinecraftSkins/",
-            "/skins/MinecraftSkins/",
-            "/MinecraftSkins/",
-            "/http/skins.minecraft.net/MinecraftSkins/",
-            "/https/skins.minecraft.net/MinecraftSkins/",
-            "/http/s3.amazonaws.com/MinecraftSkins/",
-            "/https/s3.amazonaws.com/MinecraftSkins/",
-        ]
-        legacy_cloak_prefixes = [
-            "/authserver/skins/MinecraftCloaks/",
-            "/skins/MinecraftCloaks/",
-            "/MinecraftCloaks/",
-            "/http/skins.minecraft.net/MinecraftCloaks/",
-            "/https/skins.minecraft.net/MinecraftCloaks/",
-            "/http/s3.amazonaws.com/MinecraftCloaks/",
-            "/https/s3.amazonaws.com/MinecraftCloaks/",
-        ]
-
-        matched_skin_prefix = next(
-            (pfx for pfx in legacy_skin_prefixes if path.startswith(pfx)), None
-        )
+        matched_skin_prefix = _matched_prefix(path, _LEGACY_SKIN_PREFIXES)
         if matched_skin_prefix and path.lower().endswith(".png"):
             try:
                 requested_name = unquote(
@@ -766,9 +926,7 @@ class RequestHandler(
                 self.send_error(404, "Texture not found")
                 return
 
-        matched_cloak_prefix = next(
-            (pfx for pfx in legacy_cloak_prefixes if path.startswith(pfx)), None
-        )
+        matched_cloak_prefix = _matched_prefix(path, _LEGACY_CLOAK_PREFIXES)
         if matched_cloak_prefix and path.lower().endswith(".png"):
             try:
                 requested_name = unquote(
@@ -920,9 +1078,8 @@ class RequestHandler(
 
         if path.startswith("/authserver/api/profiles/minecraft"):
             length = int(self.headers.get("Content-Length", 0))
-            body = self.rfile.read(length).decode("utf-8")
             try:
-                payload = json.loads(body) if body else None
+                payload = _fastjson.loads(self.rfile.read(length)) if length > 0 else None
             except Exception:
                 payload = None
 
@@ -973,7 +1130,7 @@ class RequestHandler(
         # Yggdrasil authenticate
         if path == "/authserver/authenticate":
             length = int(self.headers.get("Content-Length", 0))
-            body = self.rfile.read(length).decode("utf-8")
+            body = self.rfile.read(length)
             status, resp = yggdrasil.handle_auth_post(
                 path, body, self.server.server_port
             )
@@ -982,7 +1139,7 @@ class RequestHandler(
 
         if _is_yggdrasil_join_path(path):
             length = int(self.headers.get("Content-Length", 0))
-            body = self.rfile.read(length).decode("utf-8")
+            body = self.rfile.read(length)
             status, resp = yggdrasil.handle_session_join_post(path, body)
             if status == 204:
                 self.send_response(204)
@@ -1258,19 +1415,22 @@ class RequestHandler(
                         f"worlds import: {e}"
                     )
                     data = None
+            elif length <= 0:
+                # Bodyless POSTs (disconnect, refresh, ...) skip the read.
+                data = None
             else:
-                body = self.rfile.read(length).decode("utf-8")
+                body = self.rfile.read(length)
 
                 if path.startswith("/api/versions/import"):
                     safe_print(
                         f"[HTTP] POST /api/versions/import - "
                         f"Body length: {len(body)}, "
-                        f"First 100 chars: {body[:100]}"
+                        f"First 100 chars: {body[:100].decode('utf-8', 'replace')}"
                     )
 
                 try:
-                    data = json.loads(body) if body else None
-                except json.JSONDecodeError as e:
+                    data = _fastjson.loads(body) if body else None
+                except (json.JSONDecodeError, UnicodeDecodeError) as e:
                     safe_print(f"[HTTP] JSON decode error on {path}: {e}")
                     data = None
 
@@ -9,6 +9,7 @@ import urllib.request
 from urllib.parse import unquote, urlparse, quote
 from xml.sax.saxutils import escape as _xml_escape
 
+from core import _fastjson
 from core.logger import safe_print
 from core.settings import _apply_url_proxy, get_base_dir
 
@@ -174,10 +175,8 @@ class ProxyMixin:
             return ""
 
     def _rewrite_histolauncher_texture_metadata_payload(self, payload: bytes) -> bytes:
-        import json
-
         try:
-            data = json.loads((payload or b"").decode("utf-8", errors="replace"))
+            data = _fastjson.loads((payload or b"").decode("utf-8", errors="replace"))
         except Exception:
             return payload
 
@@ -200,7 +199,7 @@ class ProxyMixin:
             if isinstance(value, str) and value.strip():
                 data[key] = rewrite_texture_url(value)
 
-        return json.dumps(data).encode("utf-8")
+        return _fastjson.dumps_bytes(data)
 
     def _fetch_histolauncher_upstream(
         self,
@@ -23,7 +23,9 @@ class ThreadingHTTPServer(socketserver.ThreadingMixIn, HTTPServer):
         super().handle_error(request, client_address)
 
 
-def start_server(port):
+def start_server(port=0):
+    # Port 0 lets the OS hand out a free port; read it back from
+    # ``server.server_address``. The socket is listening once this returns.
     server = ThreadingHTTPServer(("127.0.0.1", port), RequestHandler)
     thread = threading.Thread(target=server.serve_forever, daemon=True)
     thread.start()
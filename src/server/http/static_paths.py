@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import functools
 import os
 from urllib.parse import unquote
 
@@ -16,8 +17,15 @@ from server.http._constants import UI_DIR
 __all__ = ["StaticPathsMixin"]
 
 
+@functools.lru_cache(maxsize=32)
+def _real_root(root: str) -> str:
+    # The serving roots are a handful of fixed directories; resolving one
+    # walks every path component, so do it once per root.
+    return os.path.normcase(os.path.realpath(root))
+
+
 def _safe_static_join(root: str, relative_path: str, invalid_name: str) -> str:
-    root_real = os.path.normcase(os.path.realpath(root))
+    root_real = _real_root(root)
     target_path = os.path.normpath(os.path.join(root, relative_path))
     target_real = os.path.normcase(os.path.realpath(target_path))
 
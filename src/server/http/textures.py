@@ -93,7 +93,7 @@ def _ensure_dashed_uuid(u: str) -> str:
         return u
     s = u.strip()
     if len(s) == 32:
-        return f"{s[0:8]}-{s[8:12]}-{s[12:16]}-{s[16:20]}-{s[20:32]}"
+        return yggdrasil._uuid_hex_to_dashed(s)
     return u
 
 
@@ -484,10 +484,29 @@ class TextureMixin:
 
             if local_path:
                 try:
-                    with open(local_path, "rb") as f:
-                        texture_data = f.read()
+                    merge_overlay_parts = []
+                    if texture_type == "skin" and not legacy_format:
+                        try:
+                            metadata = get_microsoft_metadata() or {}
+                            source_height = int(metadata.get("texture_height") or 0) or None
+                            metadata_texture_type = normalize_skin_texture_type(
+                                metadata.get("texture_type"),
+                                source_height=source_height,
+                            )
+                            merge_overlay_parts = normalize_skin_overlay_parts_for_texture_type(
+                                metadata.get("legacy_overlay_parts"),
+                                texture_type=metadata_texture_type,
+                                source_height=source_height,
+                                arm_mirror=metadata.get("legacy_arm_mirror"),
+                                leg_mirror=metadata.get("legacy_leg_mirror"),
+                            )
+                        except Exception:
+                            merge_overlay_parts = []
+
+                    if texture_type == "skin" and (legacy_format or merge_overlay_parts):
+                        with open(local_path, "rb") as f:
+                            texture_data = f.read()
 
-                    if texture_type == "skin":
                         if legacy_format:
                             overlay_parts, arm_mirror, leg_mirror = get_legacy_conversion_options()
                             texture_data = _crop_skin_to_legacy_format(
@@ -498,33 +517,27 @@ class TextureMixin:
                             )
                         else:
                             try:
-                                metadata = get_microsoft_metadata() or {}
-                                source_height = int(metadata.get("texture_height") or 0) or None
-                                metadata_texture_type = normalize_skin_texture_type(
-                                    metadata.get("texture_type"),
-                                    source_height=source_height,
+                                texture_data = merge_skin_overlay_into_base(
+                                    texture_data,
+                                    overlay_parts=merge_overlay_parts,
                                 )
-                                overlay_parts = normalize_skin_overlay_parts_for_texture_type(
-                                    metadata.get("legacy_overlay_parts"),
-                                    texture_type=metadata_texture_type,
-                                    source_height=source_height,
-                                    arm_mirror=metadata.get("legacy_arm_mirror"),
-                                    leg_mirror=metadata.get("legacy_leg_mirror"),
-                                )
-                                if overlay_parts:
-                                    texture_data = merge_skin_overlay_into_base(
-                                        texture_data,
-                                        overlay_parts=overlay_parts,
-                                    )
                             except Exception:
                                 pass
 
-                    self.send_response(200)
-                    self.send_header("Content-Type", "image/png")
-                    self.send_header("Content-Length", str(len(texture_data)))
-                    self.send_header("Cache-Control", f"public, max-age={cache_age}")
-                    self.end_headers()
-                    self.wfile.write(texture_data)
+                        self._send_validated_body(
+                            texture_data,
+                            "image/png",
+                            f"public, max-age={cache_age}",
+                        )
+                    else:
+                        # Served as stored, so the file goes straight from the
+                        # page cache to the socket.
+                        with open(local_path, "rb") as f:
+                            self._send_validated_file(
+                                f,
+                                "image/png",
+                                f"public, max-age={cache_age}",
+                            )
                     safe_print(
                         f"[http_server] served local {texture_type}: {texture_id}"
                     )
@@ -2,13 +2,16 @@ from __future__ import annotations
 
 import json
 import re
+import threading
 import time
 import urllib.parse
 import urllib.error
 import urllib.request
 import uuid
+from typing import TypedDict
 from urllib.parse import urlparse
 
+from core import _fastjson
 from core.logger import safe_print
 from core.settings import _apply_url_proxy, load_global_settings
 
@@ -51,6 +54,12 @@ __all__ = [
 OFFICIAL_SESSION_JOIN_URL = "https://sessionserver.mojang.com/session/minecraft/join"
 OFFICIAL_SESSION_HAS_JOINED_URL = "https://sessionserver.mojang.com/session/minecraft/hasJoined"
 _MAX_SESSION_RESPONSE_BYTES = 1 * 1024 * 1024
+_SESSION_RESPONSE_CACHE_MAX = 256
+_SESSION_NOT_FOUND_BODY = _fastjson.dumps_bytes({"error": "Not Found"})
+
+# (uuid_hex, name, port, signed) -> (texture property it was built from, body)
+_session_response_cache: dict[tuple[str, str, int, bool], tuple[dict | None, bytes]] = {}
+_session_response_lock = threading.Lock()
 
 
 def _settings_profile_name_for_uuid(uuid_hex: str) -> str:
@@ -233,11 +242,11 @@ def _forward_microsoft_session_join(data: dict) -> bool:
             "[yggdrasil] Microsoft join requested a stale profile id; using the active Microsoft account profile"
         )
 
-    body = json.dumps({
+    body = _fastjson.dumps_bytes({
         "accessToken": access_token,
         "selectedProfile": selected_profile,
         "serverId": server_id,
-    }).encode("utf-8")
+    })
     for url in _official_join_urls():
         req = urllib.request.Request(
             url,
@@ -265,36 +274,53 @@ def _forward_microsoft_session_join(data: dict) -> bool:
     return False
 
 
-def handle_auth_post(path: str, body: str, port: int):
+class _AuthProfile(TypedDict):
+    id: str
+    name: str
+
+
+class _AuthResponse(TypedDict):
+    accessToken: str
+    clientToken: str
+    selectedProfile: _AuthProfile
+    availableProfiles: list[_AuthProfile]
+
+
+def handle_auth_post(path: str, body: bytes | str, port: int):
+    # clientToken is the only request field the offline login reads.
     try:
-        data = json.loads(body) if body else {}
+        data = _fastjson.loads(body) if body else None
     except Exception:
-        data = {}
+        data = None
+    client_token = data.get("clientToken") if isinstance(data, dict) else None
+    if not isinstance(client_token, str) or not client_token:
+        client_token = "offline-client"
     username, u_hex = _get_username_and_uuid()
-    access_token = "offline-" + u_hex
-    client_token = data.get("clientToken") or "offline-client"
-    profile = {"id": u_hex, "name": username}
-    resp = {
-        "accessToken": access_token,
+    profile: _AuthProfile = {"id": u_hex, "name": username}
+    resp: _AuthResponse = {
+        "accessToken": "offline-" + u_hex,
         "clientToken": client_token,
         "selectedProfile": profile,
         "availableProfiles": [profile],
     }
-    return 200, resp
+    return 200, _fastjson.dumps_bytes(resp)
 
 
-def handle_session_get(path: str, port: int, require_signature: bool = True):
+def handle_session_get(
+    path: str, port: int, require_signature: bool = True
+) -> tuple[int, bytes]:
+    """Return ``(status, body)`` for a profile lookup; ``body`` is always encoded JSON."""
     parsed = urlparse(path)
     path_only = parsed.path or ""
     match = re.search(r"/profile/([0-9a-fA-F-]{32,36})/?$", path_only)
     if not match:
-        return 404, {"error": "Not Found"}
+        return 404, _SESSION_NOT_FOUND_BODY
 
     raw_req_id = match.group(1)
     req_uuid = _normalize_uuid_hex(raw_req_id)
 
     if not req_uuid:
-        return 404, {"error": "Not Found"}
+        return 404, _SESSION_NOT_FOUND_BODY
 
     query = urllib.parse.parse_qs(parsed.query or "")
     query_name = (query.get("username") or [""])[0].strip()
@@ -335,18 +361,31 @@ def handle_session_get(path: str, port: int, require_signature: bool = True):
 
     signature_required = any(p.get("signature") for p in props)
 
-    resp = {
-        "id": req_uuid,
-        "name": profile_name or current_name,
-        "properties": props,
-        "signatureRequired": signature_required,
-        "profileActions": [],
-    }
+    # The texture property is handed out from a cache, so while the same
+    # property object comes back the encoded response is unchanged too.
+    cache_key = (req_uuid, profile_name or current_name, int(port or 0), bool(require_signature))
+    with _session_response_lock:
+        cached = _session_response_cache.get(cache_key)
+    if cached is not None and skin_prop is not None and cached[0] is skin_prop:
+        encoded = cached[1]
+    else:
+        resp = {
+            "id": req_uuid,
+            "name": profile_name or current_name,
+            "properties": props,
+            "signatureRequired": signature_required,
+            "profileActions": [],
+        }
+        encoded = _fastjson.dumps_bytes(resp)
+        with _session_response_lock:
+            if len(_session_response_cache) >= _SESSION_RESPONSE_CACHE_MAX:
+                _session_response_cache.clear()
+            _session_response_cache[cache_key] = (skin_prop, encoded)
     safe_print(
         f"[yggdrasil] session profile served: uuid={req_uuid}, "
         f"signature_required={signature_required}"
     )
-    return 200, resp
+    return 200, encoded
 
 
 def handle_services_profile_get(port: int):
@@ -462,9 +501,9 @@ def handle_player_certificates():
     }
 
 
-def handle_session_join_post(path: str, body: str):
+def handle_session_join_post(path: str, body: bytes | str):
     try:
-        data = json.loads(body) if body else {}
+        data = _fastjson.loads(body) if body else {}
     except Exception:
         data = {}
 
@@ -1,12 +1,17 @@
 from __future__ import annotations
 
+import functools
 import hashlib
+import threading
+import time
 import uuid
 from typing import Tuple
 
 from core.logger import safe_print
 from core.settings import load_global_settings
 
+from server.yggdrasil.state import ACCOUNT_IDENTITY_TTL_SECONDS
+
 
 __all__ = [
     "_active_account_scope",
@@ -19,6 +24,11 @@ __all__ = [
 ]
 
 
+# (account_type, settings username) -> (verified_at, (username, uuid_hex))
+_account_identity_cache: dict[tuple[str, str], tuple[float, Tuple[str, str]]] = {}
+_account_identity_lock = threading.Lock()
+
+
 def _active_account_scope() -> str:
     try:
         settings = load_global_settings() or {}
@@ -38,6 +48,7 @@ def _histolauncher_account_enabled() -> bool:
         return False
 
 
+@functools.lru_cache(maxsize=256)
 def _ensure_uuid(username: str) -> str:
     digest = hashlib.md5(("OfflinePlayer:" + (username or "")).encode("utf-8")).digest()
     as_list = bytearray(digest)
@@ -51,6 +62,28 @@ def _get_username_and_uuid() -> Tuple[str, str]:
     account_type = str(settings.get("account_type", "Local") or "Local").strip()
     account_type_norm = account_type.lower()
 
+    if account_type_norm in {"microsoft", "histolauncher"}:
+        # Verifying a signed-in account can mean a token refresh or an /api/me
+        # round trip, and a single game login asks for the identity several
+        # times over; reuse a recent verification.
+        cache_key = (account_type_norm, str(settings.get("username") or ""))
+        with _account_identity_lock:
+            cached = _account_identity_cache.get(cache_key)
+        if cached is not None and time.monotonic() - cached[0] < ACCOUNT_IDENTITY_TTL_SECONDS:
+            return cached[1]
+        identity = _verified_account_identity(account_type_norm)
+        if identity is not None:
+            with _account_identity_lock:
+                _account_identity_cache.clear()
+                _account_identity_cache[cache_key] = (time.monotonic(), identity)
+            return identity
+
+    username = (settings.get("username") or "Player").strip() or "Player"
+    u = _ensure_uuid(username)
+    return username, u.replace("-", "")
+
+
+def _verified_account_identity(account_type_norm: str) -> Tuple[str, str] | None:
     if account_type_norm == "microsoft":
         try:
             from server.auth.microsoft import get_verified_microsoft_account
@@ -85,13 +118,18 @@ def _get_username_and_uuid() -> Tuple[str, str]:
         except Exception as e:
             safe_print(f"[yggdrasil] Failed to verify Histolauncher session: {e}")
 
-    username = (settings.get("username") or "Player").strip() or "Player"
-    u = _ensure_uuid(username)
-    return username, u.replace("-", "")
+    return None
 
 
 def _normalize_uuid_hex(value: str | None) -> str:
-    raw = str(value or "").strip().replace("-", "")
+    # Callers pass raw JSON fields; coerce before hitting the cache so an
+    # unhashable value normalizes to "" instead of raising TypeError.
+    return _normalize_uuid_hex_str(str(value or ""))
+
+
+@functools.lru_cache(maxsize=256)
+def _normalize_uuid_hex_str(value: str) -> str:
+    raw = value.strip().replace("-", "")
     if len(raw) != 32:
         return ""
     try:
@@ -126,6 +164,7 @@ def _profile_matches_active_player(uuid_hex: str = "", username: str = "") -> bo
     return bool(offline_uuid and target_uuid == offline_uuid)
 
 
+@functools.lru_cache(maxsize=256)
 def _uuid_hex_to_dashed(u_hex: str) -> str:
     return (
         f"{u_hex[0:8]}-{u_hex[8:12]}-{u_hex[12:16]}-"
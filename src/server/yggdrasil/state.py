@@ -13,6 +13,8 @@ __all__ = [
     "HISTOLAUNCHER_TEXTURE_METADATA_TTL_SECONDS",
     "TEXTURE_PROP_CACHE_TTL_SECONDS",
     "SESSION_JOIN_TTL_SECONDS",
+    "ACCOUNT_IDENTITY_TTL_SECONDS",
+    "TEXTURE_PROPERTY_SIGNATURE",
 ]
 
 
@@ -24,6 +26,11 @@ TEXTURE_METADATA_CACHE_TTL_SECONDS = 600
 HISTOLAUNCHER_TEXTURE_METADATA_TTL_SECONDS = 60
 TEXTURE_PROP_CACHE_TTL_SECONDS = 60
 SESSION_JOIN_TTL_SECONDS = 300
+ACCOUNT_IDENTITY_TTL_SECONDS = 30
+
+# No signing key is published (signaturePublickey is null), so clients that
+# ask for a signed property only need the field to be present.
+TEXTURE_PROPERTY_SIGNATURE = "AA=="
 
 
 class _YggdrasilState:
@@ -3,6 +3,8 @@ from __future__ import annotations
 import json
 import os
 import re
+import stat
+import threading
 import time
 
 from server.yggdrasil.identity import _uuid_hex_to_dashed
@@ -26,6 +28,10 @@ __all__ = [
 
 _SAFE_IDENTIFIER_RE = re.compile(r"^[A-Za-z0-9_\-]{1,128}$")
 
+# path -> ((st_mtime_ns, st_size), dimensions)
+_png_dimensions_cache: dict[str, tuple[tuple[int, int], tuple[int, int] | None]] = {}
+_png_dimensions_lock = threading.Lock()
+
 
 def _is_safe_identifier(identifier: str) -> bool:
     if not identifier:
@@ -70,12 +76,33 @@ def _read_png_dimensions(path: str) -> tuple[int, int] | None:
         return None
 
 
+def _cached_png_dimensions(path: str) -> tuple[int, int] | None:
+    # Texture lookups probe several candidate files per request; a file that
+    # is unchanged since it was last probed costs one stat instead of an
+    # open/read/close.
+    try:
+        st = os.stat(path)
+    except (OSError, ValueError):
+        return None
+    if not stat.S_ISREG(st.st_mode):
+        return None
+    signature = (st.st_mtime_ns, st.st_size)
+    with _png_dimensions_lock:
+        cached = _png_dimensions_cache.get(path)
+    if cached is not None and cached[0] == signature:
+        return cached[1]
+    dimensions = _read_png_dimensions(path)
+    with _png_dimensions_lock:
+        _png_dimensions_cache[path] = (signature, dimensions)
+    return dimensions
+
+
 def _is_valid_local_texture_file(path: str, texture_type: str) -> bool:
-    if not path or not os.path.isfile(path):
+    if not path:
         return False
 
     safe_type = str(texture_type or "").strip().lower()
-    dimensions = _read_png_dimensions(path)
+    dimensions = _cached_png_dimensions(path)
     if not dimensions:
         return False
 
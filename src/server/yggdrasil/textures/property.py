@@ -11,6 +11,7 @@ import urllib.request
 from concurrent.futures import ThreadPoolExecutor
 from urllib.parse import unquote, urlparse
 
+from core import _fastjson
 from core.settings import _apply_url_proxy, load_global_settings
 
 from server.yggdrasil.identity import (
@@ -20,7 +21,11 @@ from server.yggdrasil.identity import (
     _profile_matches_active_player,
     _uuid_hex_to_dashed,
 )
-from server.yggdrasil.state import STATE, TEXTURE_PROP_CACHE_TTL_SECONDS
+from server.yggdrasil.state import (
+    STATE,
+    TEXTURE_PROP_CACHE_TTL_SECONDS,
+    TEXTURE_PROPERTY_SIGNATURE,
+)
 from server.yggdrasil.textures.local import (
     _has_local_skin_file,
     _is_valid_local_texture_file,
@@ -353,12 +358,12 @@ def _build_texture_property(
     if profile_name:
         tex["profileName"] = profile_name
 
-    json_bytes = json.dumps(tex).encode("utf-8")
+    json_bytes = _fastjson.dumps_bytes(tex)
     encoded = base64.b64encode(json_bytes).decode("utf-8")
 
     prop = {"name": "textures", "value": encoded}
     if require_signature:
-        prop["signature"] = "AA=="
+        prop["signature"] = TEXTURE_PROPERTY_SIGNATURE
     return prop
 
 
@@ -633,23 +638,15 @@ def _get_skin_property(
         username, current_u_hex = target_name, target_u_hex
     else:
         username, current_u_hex = _get_username_and_uuid()
-    microsoft_enabled = _microsoft_account_enabled()
     u_hex = target_u_hex or current_u_hex
     profile_name = _resolve_profile_name_for_target(
         u_hex, target_username, username, current_u_hex
     )
-    is_current_profile = _profile_matches_active_player(u_hex, profile_name)
-    active_username = ""
-    active_uuid_hex = ""
-    if is_current_profile:
-        try:
-            active_username, active_uuid_hex = _get_username_and_uuid()
-        except Exception:
-            active_username = profile_name
-            active_uuid_hex = ""
     if u_hex and profile_name:
         STATE.uuid_name_cache[u_hex] = profile_name
 
+    # Checked before the account lookups below: each of them can re-verify
+    # the signed-in account, and none of them feed the cache key.
     cached = _get_cached_texture_property(
         u_hex,
         profile_name,
@@ -660,6 +657,17 @@ def _get_skin_property(
     if cached:
         return cached
 
+    microsoft_enabled = _microsoft_account_enabled()
+    is_current_profile = _profile_matches_active_player(u_hex, profile_name)
+    active_username = ""
+    active_uuid_hex = ""
+    if is_current_profile:
+        try:
+            active_username, active_uuid_hex = _get_username_and_uuid()
+        except Exception:
+            active_username = profile_name
+            active_uuid_hex = ""
+
     cape_url = None
 
     skin_model = _resolve_cached_skin_model(u_hex, profile_name) or "classic"